@@ -1,25 +1,94 @@
 //! HTTP client with OAuth2 token management.
 
+use std::io::Write;
+use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
 use reqwest::{Client, Method, RequestBuilder, StatusCode};
-use serde::Serialize;
 use serde::de::DeserializeOwned;
+use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
 use tokio::sync::RwLock;
 
 use boxlite_shared::errors::{BoxliteError, BoxliteResult};
 
+use crate::runtime::constants::envs;
+
 use super::error::{map_http_error, map_http_status};
 use super::options::BoxliteRestOptions;
 use super::types::{ErrorResponse, TokenRequest, TokenResponse};
 
 /// Cached OAuth2 token with expiry.
+#[derive(Serialize, Deserialize)]
 struct TokenCache {
     token: String,
     /// Expiry as seconds since epoch.
     expires_at: u64,
 }
 
+fn unix_now() -> u64 {
+    std::time::SystemTime::now()
+        .duration_since(std::time::UNIX_EPOCH)
+        .unwrap_or_default()
+        .as_secs()
+}
+
+/// Return the cached token unless it is missing or about to expire.
+fn fresh_token(cache: &Option<TokenCache>) -> Option<String> {
+    let cached = cache.as_ref()?;
+    // Refresh 60 seconds before expiry
+    (unix_now() + 60 < cached.expires_at).then(|| cached.token.clone())
+}
+
+/// Location of the on-disk token cache for these credentials, if enabled.
+///
+/// The file name is derived from the server and credentials, so rotating
+/// the secret or switching servers never picks up a stale token.
+fn token_cache_path(config: &BoxliteRestOptions) -> Option<PathBuf> {
+    let disabled = std::env::var_os(envs::BOXLITE_REST_NO_TOKEN_CACHE).is_some();
+    token_cache_path_with(config, disabled)
+}
+
+fn token_cache_path_with(config: &BoxliteRestOptions, disabled: bool) -> Option<PathBuf> {
+    if disabled {
+        return None;
+    }
+    let (client_id, client_secret) = (config.client_id.as_ref()?, config.client_secret.as_ref()?);
+
+    let mut hasher = Sha256::new();
+    for part in [
+        config.url.trim_end_matches('/'),
+        config.effective_prefix(),
+        client_id.as_str(),
+        client_secret.as_str(),
+    ] {
+        hasher.update(part.as_bytes());
+        hasher.update(b"\0");
+    }
+    let key = hex::encode(&hasher.finalize()[..8]);
+
+    Some(
+        dirs::cache_dir()?
+            .join("boxlite")
+            .join(format!("rest-token-{}.json", key)),
+    )
+}
+
+fn load_token(path: &Path) -> Option<TokenCache> {
+    let data = std::fs::read(path).ok()?;
+    serde_json::from_slice(&data).ok()
+}
+
+/// Write the token atomically; the temp file is created owner-only.
+fn store_token(path: &Path, entry: &TokenCache) -> std::io::Result<()> {
+    let dir = path.parent().unwrap_or(Path::new("."));
+    std::fs::create_dir_all(dir)?;
+    let mut file = tempfile::NamedTempFile::new_in(dir)?;
+    file.write_all(&serde_json::to_vec(entry)?)?;
+    file.persist(path)?;
+    Ok(())
+}
+
 /// HTTP client for the BoxLite REST API.
 ///
 /// Handles base URL construction, OAuth2 token caching/refresh,
@@ -32,6 +101,8 @@ pub(crate) struct ApiClient {
     client_id: Option<String>,
     client_secret: Option<String>,
     token_cache: Arc<RwLock<Option<TokenCache>>>,
+    /// Where the token is persisted across processes (None = memory only).
+    token_file: Option<PathBuf>,
 }
 
 impl ApiClient {
@@ -51,6 +122,7 @@ impl ApiClient {
             client_id: config.client_id.clone(),
             client_secret: config.client_secret.clone(),
             token_cache: Arc::new(RwLock::new(None)),
+            token_file: token_cache_path(config),
         })
     }
 
@@ -73,17 +145,22 @@ impl ApiClient {
         };
 
         // Check cached token
-        {
-            let cache = self.token_cache.read().await;
-            if let Some(ref cached) = *cache {
-                let now = std::time::SystemTime::now()
-                    .duration_since(std::time::UNIX_EPOCH)
-                    .unwrap_or_default()
-                    .as_secs();
-                // Refresh 60 seconds before expiry
-                if now + 60 < cached.expires_at {
-                    return Ok(Some(cached.token.clone()));
-                }
+        if let Some(token) = fresh_token(&*self.token_cache.read().await) {
+            return Ok(Some(token));
+        }
+
+        // Hold the write lock across the refresh so concurrent callers wait
+        // for one token exchange instead of each starting their own.
+        let mut cache = self.token_cache.write().await;
+        if let Some(token) = fresh_token(&cache) {
+            return Ok(Some(token));
+        }
+
+        // Reuse a token persisted by an earlier process
+        if cache.is_none() {
+            *cache = self.token_file.as_deref().and_then(load_token);
+            if let Some(token) = fresh_token(&cache) {
+                return Ok(Some(token));
             }
         }
 
@@ -117,23 +194,31 @@ impl ApiClient {
             .await
             .map_err(|e| BoxliteError::Config(format!("failed to parse token response: {}", e)))?;
 
-        let now = std::time::SystemTime::now()
-            .duration_since(std::time::UNIX_EPOCH)
-            .unwrap_or_default()
-            .as_secs();
-
         let token = token_resp.access_token.clone();
-        let expires_at = now + token_resp.expires_in;
+        let expires_at = unix_now() + token_resp.expires_in;
 
-        let mut cache = self.token_cache.write().await;
-        *cache = Some(TokenCache {
+        let entry = TokenCache {
             token: token.clone(),
             expires_at,
-        });
+        };
+        if let Some(path) = &self.token_file
+            && let Err(e) = store_token(path, &entry)
+        {
+            tracing::debug!("failed to persist REST token to {}: {}", path.display(), e);
+        }
+        *cache = Some(entry);
 
         Ok(Some(token))
     }
 
+    /// Forget the cached token so the next request fetches a new one.
+    async fn invalidate_token(&self) {
+        *self.token_cache.write().await = None;
+        if let Some(path) = &self.token_file {
+            let _ = std::fs::remove_file(path);
+        }
+    }
+
     /// Add auth header to a request builder.
     async fn authorize(&self, builder: RequestBuilder) -> BoxliteResult<RequestBuilder> {
         if let Some(token) = self.get_token().await? {
@@ -183,6 +268,10 @@ impl ApiClient {
         status: StatusCode,
         resp: reqwest::Response,
     ) -> BoxliteResult<T> {
+        if status == StatusCode::UNAUTHORIZED {
+            // The token may have been revoked before its expiry
+            self.invalidate_token().await;
+        }
         let text = resp.text().await.unwrap_or_default();
         if let Ok(err_resp) = serde_json::from_str::<ErrorResponse>(&text) {
             Err(map_http_error(status, &err_resp.error))
@@ -288,3 +377,96 @@ impl ApiClient {
         self.send_no_content(builder).await
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn cache_expiring_in(secs: u64) -> Option<TokenCache> {
+        Some(TokenCache {
+            token: "tok".into(),
+            expires_at: unix_now() + secs,
+        })
+    }
+
+    fn options(url: &str, secret: &str) -> BoxliteRestOptions {
+        BoxliteRestOptions::new(url).with_credentials("id".into(), secret.into())
+    }
+
+    #[test]
+    fn test_fresh_token_valid() {
+        assert_eq!(
+            fresh_token(&cache_expiring_in(3600)).as_deref(),
+            Some("tok")
+        );
+        assert_eq!(fresh_token(&cache_expiring_in(90)).as_deref(), Some("tok"));
+    }
+
+    #[test]
+    fn test_fresh_token_within_refresh_margin() {
+        assert!(fresh_token(&cache_expiring_in(60)).is_none());
+        assert!(fresh_token(&cache_expiring_in(30)).is_none());
+    }
+
+    #[test]
+    fn test_fresh_token_expired_or_missing() {
+        let expired = Some(TokenCache {
+            token: "tok".into(),
+            expires_at: unix_now().saturating_sub(10),
+        });
+        assert!(fresh_token(&expired).is_none());
+        assert!(fresh_token(&None).is_none());
+    }
+
+    #[test]
+    fn test_token_cache_path() {
+        let base = options("https://api.example.com", "secret");
+        let path = |opts: &BoxliteRestOptions| token_cache_path_with(opts, false);
+        assert!(path(&BoxliteRestOptions::new("https://api.example.com")).is_none());
+
+        if let Some(p) = path(&base) {
+            assert_eq!(path(&base), Some(p.clone()));
+            // Trailing slash is not a different server
+            assert_eq!(
+                path(&options("https://api.example.com/", "secret")),
+                Some(p.clone())
+            );
+            assert_ne!(
+                path(&options("https://api.example.com", "rotated")),
+                Some(p.clone())
+            );
+            assert_ne!(
+                path(&options("https://other.example.com", "secret")),
+                Some(p)
+            );
+        }
+    }
+
+    #[test]
+    fn test_token_cache_path_disabled() {
+        let base = options("https://api.example.com", "secret");
+        assert!(token_cache_path_with(&base, true).is_none());
+    }
+
+    #[test]
+    fn test_store_and_load_token() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("nested").join("rest-token.json");
+        assert!(load_token(&path).is_none());
+
+        store_token(
+            &path,
+            &TokenCache {
+                token: "tok".into(),
+                expires_at: 1234,
+            },
+        )
+        .unwrap();
+        let loaded = load_token(&path).unwrap();
+        assert_eq!(loaded.token, "tok");
+        assert_eq!(loaded.expires_at, 1234);
+
+        std::fs::write(&path, b"not json").unwrap();
+        assert!(load_token(&path).is_none());
+    }
+}
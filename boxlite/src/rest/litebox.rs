@@ -71,7 +71,7 @@ impl BoxBackend for RestBox {
         let path = format!("/boxes/{}/start", box_id);
         let resp: BoxResponse = self.client.post_empty(&path).await?;
         let mut info = self.cached_info.write();
-        *info = resp.to_box_info();
+        *info = resp.into_box_info();
         Ok(())
     }
 
@@ -142,7 +142,7 @@ impl BoxBackend for RestBox {
         let path = format!("/boxes/{}/stop", box_id);
         let resp: BoxResponse = self.client.post_empty(&path).await?;
         let mut info = self.cached_info.write();
-        *info = resp.to_box_info();
+        *info = resp.into_box_info();
         Ok(())
     }
 
@@ -154,8 +154,12 @@ impl BoxBackend for RestBox {
     ) -> BoxliteResult<()> {
         let box_id = self.box_id_str();
 
-        // Create tar archive from host path
-        let tar_bytes = create_tar_from_path(host_src)?;
+        // Create tar archive from host path off the async runtime, so
+        // concurrent uploads are not stalled behind filesystem reads
+        let src = host_src.to_path_buf();
+        let tar_bytes = tokio::task::spawn_blocking(move || create_tar_from_path(&src))
+            .await
+            .map_err(|e| BoxliteError::Internal(format!("spawn_blocking failed: {}", e)))??;
 
         // Upload tar to server
         let encoded_dst = urlencoding::encode(container_dst);
@@ -220,7 +224,10 @@ impl BoxBackend for RestBox {
             .map_err(|e| BoxliteError::Internal(format!("copy_out read body failed: {}", e)))?;
 
         // Extract tar to host path
-        extract_tar_to_path(&tar_bytes, host_dst)
+        let dst = host_dst.to_path_buf();
+        tokio::task::spawn_blocking(move || extract_tar_to_path(&tar_bytes, &dst))
+            .await
+            .map_err(|e| BoxliteError::Internal(format!("spawn_blocking failed: {}", e)))?
     }
 }
 
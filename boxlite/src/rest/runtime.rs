@@ -30,7 +30,7 @@ impl RuntimeBackend for RestRuntime {
     async fn create(&self, options: BoxOptions, name: Option<String>) -> BoxliteResult<LiteBox> {
         let req = CreateBoxRequest::from_options(&options, name);
         let resp: BoxResponse = self.client.post("/boxes", &req).await?;
-        let info = resp.to_box_info();
+        let info = resp.into_box_info();
         let rest_box = RestBox::new(self.client.clone(), info);
         Ok(LiteBox::new(Arc::new(rest_box)))
     }
@@ -55,7 +55,7 @@ impl RuntimeBackend for RestRuntime {
         let path = format!("/boxes/{}", id_or_name);
         match self.client.get::<BoxResponse>(&path).await {
             Ok(resp) => {
-                let info = resp.to_box_info();
+                let info = resp.into_box_info();
                 let rest_box = RestBox::new(self.client.clone(), info);
                 Ok(Some(LiteBox::new(Arc::new(rest_box))))
             }
@@ -67,7 +67,7 @@ impl RuntimeBackend for RestRuntime {
     async fn get_info(&self, id_or_name: &str) -> BoxliteResult<Option<BoxInfo>> {
         let path = format!("/boxes/{}", id_or_name);
         match self.client.get::<BoxResponse>(&path).await {
-            Ok(resp) => Ok(Some(resp.to_box_info())),
+            Ok(resp) => Ok(Some(resp.into_box_info())),
             Err(BoxliteError::NotFound(_)) => Ok(None),
             Err(e) => Err(e),
         }
@@ -75,7 +75,11 @@ impl RuntimeBackend for RestRuntime {
 
     async fn list_info(&self) -> BoxliteResult<Vec<BoxInfo>> {
         let resp: ListBoxesResponse = self.client.get("/boxes").await?;
-        Ok(resp.boxes.iter().map(|b| b.to_box_info()).collect())
+        Ok(resp
+            .boxes
+            .into_iter()
+            .map(BoxResponse::into_box_info)
+            .collect())
     }
 
     async fn exists(&self, id_or_name: &str) -> BoxliteResult<bool> {
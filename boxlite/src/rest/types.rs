@@ -133,7 +133,8 @@ pub(crate) struct BoxResponse {
 }
 
 impl BoxResponse {
-    pub fn to_box_info(&self) -> crate::BoxInfo {
+    /// Convert into a core `BoxInfo`, moving the string fields out.
+    pub fn into_box_info(self) -> crate::BoxInfo {
         use crate::litebox::BoxStatus;
         use crate::runtime::types::BoxID;
 
@@ -157,15 +158,15 @@ impl BoxResponse {
 
         crate::BoxInfo {
             id,
-            name: self.name.clone(),
+            name: self.name,
             status,
             created_at,
             last_updated,
             pid: self.pid,
-            image: self.image.clone(),
+            image: self.image,
             cpus: self.cpus,
             memory_mib: self.memory_mib,
-            labels: self.labels.clone(),
+            labels: self.labels,
         }
     }
 }
@@ -355,7 +356,7 @@ mod tests {
     }
 
     #[test]
-    fn test_box_response_to_box_info() {
+    fn test_box_response_into_box_info() {
         let resp = BoxResponse {
             box_id: "01J0000000000000000000000A".to_string(),
             name: Some("mybox".to_string()),
@@ -368,7 +369,7 @@ mod tests {
             memory_mib: 512,
             labels: HashMap::new(),
         };
-        let info = resp.to_box_info();
+        let info = resp.into_box_info();
         assert_eq!(info.name.as_deref(), Some("mybox"));
         assert_eq!(info.image, "python:3.11");
         assert_eq!(info.cpus, 2);
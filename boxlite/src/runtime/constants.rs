@@ -33,6 +33,10 @@ pub mod envs {
     /// API path prefix (default: "v1").
     #[cfg(feature = "rest")]
     pub const BOXLITE_REST_PREFIX: &str = "BOXLITE_REST_PREFIX";
+
+    /// Set to disable persisting the OAuth2 token under the user cache dir.
+    #[cfg(feature = "rest")]
+    pub const BOXLITE_REST_NO_TOKEN_CACHE: &str = "BOXLITE_REST_NO_TOKEN_CACHE";
 }
 
 /// Container images used by the runtime
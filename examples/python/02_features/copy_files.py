@@ -19,26 +19,77 @@ Requirements:
 """
 
 import asyncio
-import io
-import tarfile
 from pathlib import Path
+from typing import Callable, Iterable
 
 from boxlite import Boxlite, BoxOptions, CopyOptions, SimpleBox
 
 
 # ---------------------------------------------------------------------------
-# Helper: create an in-memory tar archive
+# Helper: stream an in-memory tar archive
 # ---------------------------------------------------------------------------
 
-def make_tar(files: dict[str, bytes]) -> bytes:
-    """Create an in-memory tar archive from a dict of {path: content}."""
-    buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w") as tar:
-        for name, data in files.items():
+# 64 KiB records: one pipe-buffer-sized write per send_input() instead of
+# tarfile's default 10 KiB records.
+TAR_BLOCK_SIZE = 64 * 1024
+
+
+# (name, size, chunks): chunks() is called once and yields the entry's content
+TarEntry = tuple[str, int, Callable[[], Iterable[bytes]]]
+
+
+def bytes_entry(name: str, data: bytes) -> TarEntry:
+    """Tar entry for content that is already in memory."""
+    return name, len(data), lambda: (memoryview(data),)
+
+
+def iter_tar_chunks(entries: Iterable[TarEntry], block: int = TAR_BLOCK_SIZE):
+    """Yield a tar archive of ``entries`` in chunks of ``block`` bytes.
+
+    Entry content is pulled lazily and only one block is held in memory at a
+    time, so the archive can be written to the container's stdin while it is
+    still being built, whatever its total size.
+    """
+    # Imported here: only the tar-pipe examples need tarfile
+    import tarfile
+
+    # Stream mode hands the sink exactly one ``block``-sized record per write,
+    # so records are yielded as-is with no intermediate buffer to grow/reset.
+    sink = _RecordSink()
+    with tarfile.open(fileobj=sink, mode="w|", bufsize=block) as tar:
+        for name, size, chunks in entries:
+            # Same layout as TarFile.addfile(): header, content, NUL padding
             info = tarfile.TarInfo(name=name)
-            info.size = len(data)
-            tar.addfile(info, io.BytesIO(data))
-    return buf.getvalue()
+            info.size = size
+            header = info.tobuf(tar.format, tar.encoding, tar.errors)
+            tar.fileobj.write(header)
+            written = 0
+            for chunk in chunks():
+                tar.fileobj.write(chunk)
+                written += len(chunk)
+                yield from sink.take()
+            if written != size:
+                raise ValueError(f"{name}: expected {size} bytes, got {written}")
+            padding = -size % tarfile.BLOCKSIZE
+            tar.fileobj.write(b"\0" * padding)
+            tar.offset += len(header) + size + padding
+    # Closing the archive appends the end-of-archive blocks
+    yield from sink.take()
+
+
+class _RecordSink:
+    """Write-only file object that collects tar records until taken."""
+
+    def __init__(self):
+        self._records: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._records.append(data)
+        return len(data)
+
+    def take(self) -> list[bytes]:
+        records, self._records = self._records, []
+        return records
 
 
 # ---------------------------------------------------------------------------
@@ -68,17 +119,15 @@ async def example_copy_in_out():
     result = await exec_handle.wait()
     print("exit code:", result.exit_code)
 
-    # Copy back out
-    out_dir = Path("/tmp/boxlite_py_copy_out")
-    if out_dir.exists():
-        import shutil
-        shutil.rmtree(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
+    # Copy back out into a fresh directory (no need to clear a stale tree first)
+    import tempfile
+    with tempfile.TemporaryDirectory(prefix="boxlite_py_copy_out_") as tmp:
+        out_dir = Path(tmp)
 
-    print("Copying back to host ...")
-    await box.copy_out("/app", str(out_dir), copy_options=CopyOptions())
-    roundtrip_path = out_dir / "app" / host_dir.name / "hello.txt"
-    print("Round-trip file content:", roundtrip_path.read_text())
+        print("Copying back to host ...")
+        await box.copy_out("/app", str(out_dir), copy_options=CopyOptions())
+        roundtrip_path = out_dir / "app" / host_dir.name / "hello.txt"
+        print("Round-trip file content:", roundtrip_path.read_text())
 
     await box.stop()
 
@@ -101,27 +150,35 @@ async def example_tmpfs_workaround():
 
         try:
             await box.copy_in(host_file, "/tmp/ghost.txt")
-            result = await box.exec("ls", "/tmp/ghost.txt")
-            print(f"copy_in to /tmp:     exit={result.exit_code}  "
-                  f"{'FOUND' if result.exit_code == 0 else 'NOT FOUND (expected)'}")
         finally:
             os.unlink(host_file)
 
         # --- The workaround: pipe tar through container process ---
-        tar_data = make_tar({"hello.txt": b"visible!\n"})
-
+        # One exec checks for ghost.txt, extracts the tar from stdin and reads
+        # the result back, instead of a round-trip (and process) per step.
+        # Each stage reports on its own "<stage>=<status>" sentinel line.
+        script = (
+            "ls /tmp/ghost.txt >/dev/null 2>&1; echo ghost=$?; "
+            "tar xf - -C /tmp; echo tar=$?; "
+            "cat /tmp/hello.txt"
+        )
         # TODO: Replace with public stdin API once available.
         # Currently requires the low-level _box handle for stdin access.
-        execution = await box._box.exec("tar", args=["xf", "-", "-C", "/tmp"])
+        execution = await box._box.exec("sh", args=["-c", script])
         stdin = execution.stdin()
-        await stdin.send_input(tar_data)
+        stdout = execution.stdout()
+        for chunk in iter_tar_chunks([bytes_entry("hello.txt", b"visible!\n")]):
+            await stdin.send_input(chunk)
         await stdin.close()
-        result = await execution.wait()
-        print(f"tar via stdin:       exit={result.exit_code}")
-
-        result = await box.exec("cat", "/tmp/hello.txt")
-        print(f"read /tmp/hello.txt: {result.stdout.strip()}")
+        output = "".join([chunk async for chunk in stdout])
+        await execution.wait()
 
+        ghost, tar, content = output.split("\n", 2)
+        ghost_exit = int(ghost.removeprefix("ghost="))
+        print(f"copy_in to /tmp:     exit={ghost_exit}  "
+              f"{'FOUND' if ghost_exit == 0 else 'NOT FOUND (expected)'}")
+        print(f"tar via stdin:       exit={tar.removeprefix('tar=')}")
+        print(f"read /tmp/hello.txt: {content.strip()}")
 
 
 # ---------------------------------------------------------------------------
@@ -135,13 +192,12 @@ def example_tmpfs_workaround_sync():
     from boxlite import SyncSimpleBox
 
     with SyncSimpleBox("alpine:latest", name="sync-tmpfs-cp-demo") as box:
-        tar_data = make_tar({"hello_sync.txt": b"visible from sync!\n"})
-
         # TODO: Replace with public stdin API once available.
         # Currently requires the low-level _box handle for stdin access.
         execution = box._box.exec("tar", ["xf", "-", "-C", "/tmp"])
         stdin = execution.stdin()
-        stdin.send_input(tar_data)
+        for chunk in iter_tar_chunks([bytes_entry("hello_sync.txt", b"visible from sync!\n")]):
+            stdin.send_input(chunk)
         stdin.close()
         result = execution.wait()
         print(f"tar via stdin:       exit={result.exit_code}")
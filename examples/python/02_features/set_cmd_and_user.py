@@ -25,7 +25,7 @@ except ImportError:
 logger = logging.getLogger("cmd_user_example")
 
 
-async def example_cmd_override():
+async def example_cmd_override(out: list[str]):
     """Example 1: Override ENTRYPOINT and CMD.
 
     OCI images have two directives:
@@ -38,23 +38,23 @@ async def example_cmd_override():
     To pass arguments like `-c`, we set entrypoint=["python3"] explicitly
     so that cmd args are appended to it.
     """
-    print("\n=== Example 1: CMD Override ===")
+    out.append("\n=== Example 1: CMD Override ===")
 
     async with boxlite.SimpleBox(
         image="python:alpine",
         entrypoint=["python3"],
         cmd=["-c", "import sys; print(f'Python {sys.version}')"],
     ) as box:
-        print(f"Container started: {box.id}")
+        out.append(f"Container started: {box.id}")
 
         # The CMD is used by the init process (entrypoint + cmd).
         # We can still run additional commands:
         result = await box.exec("python3", "-c", "print('Hello from exec')")
-        print(f"Exec output: {result.stdout.strip()}")
-        print(f"Exit code: {result.exit_code}")
+        out.append(f"Exec output: {result.stdout.strip()}")
+        out.append(f"Exit code: {result.exit_code}")
 
 
-async def example_user_override():
+async def example_user_override(out: list[str]):
     """Example 2: Run as non-root user.
 
     By default, containers run as root (uid=0). The user option accepts
@@ -62,77 +62,77 @@ async def example_user_override():
 
     Setting user="1000:1000" changes the container user to uid 1000, gid 1000.
     """
-    print("\n=== Example 2: User Override ===")
+    out.append("\n=== Example 2: User Override ===")
 
     async with boxlite.SimpleBox(
         image="alpine:latest",
         user="1000:1000",
     ) as box:
-        print(f"Container started: {box.id}")
+        out.append(f"Container started: {box.id}")
 
         # Verify the user inside the container
         result = await box.exec("id")
-        print(f"Container user: {result.stdout.strip()}")
+        out.append(f"Container user: {result.stdout.strip()}")
 
         # Verify uid specifically
         result = await box.exec("id", "-u")
         uid = result.stdout.strip()
-        print(f"UID: {uid}")
+        out.append(f"UID: {uid}")
         assert uid == "1000", f"Expected UID 1000, got {uid}"
 
 
-async def example_username_resolution():
+async def example_username_resolution(out: list[str]):
     """Example 3: Resolve username from /etc/passwd.
 
     Non-numeric usernames are resolved from the container's /etc/passwd.
     Alpine has 'nobody' (uid=65534, gid=65534) in its /etc/passwd.
     """
-    print("\n=== Example 3: Username Resolution ===")
+    out.append("\n=== Example 3: Username Resolution ===")
 
     async with boxlite.SimpleBox(
         image="alpine:latest",
         user="nobody",
     ) as box:
-        print(f"Container started: {box.id}")
+        out.append(f"Container started: {box.id}")
 
         result = await box.exec("id")
-        print(f"Container user: {result.stdout.strip()}")
+        out.append(f"Container user: {result.stdout.strip()}")
 
         result = await box.exec("id", "-u")
         uid = result.stdout.strip()
-        print(f"UID: {uid}")
+        out.append(f"UID: {uid}")
         assert uid == "65534", f"Expected UID 65534 (nobody), got {uid}"
 
 
-async def example_user_group_resolution():
+async def example_user_group_resolution(out: list[str]):
     """Example 4: Resolve user:group from /etc/passwd and /etc/group.
 
     Username or UID (format: <name|uid>[:<group|gid>]).
     Supports all combinations: name:group, name:gid, uid:group, uid:gid.
     """
-    print("\n=== Example 4: User:Group Resolution ===")
+    out.append("\n=== Example 4: User:Group Resolution ===")
 
     async with boxlite.SimpleBox(
         image="alpine:latest",
         user="nobody:nobody",
     ) as box:
-        print(f"Container started: {box.id}")
+        out.append(f"Container started: {box.id}")
 
         result = await box.exec("id")
-        print(f"Container user: {result.stdout.strip()}")
+        out.append(f"Container user: {result.stdout.strip()}")
 
         result = await box.exec("id", "-g")
         gid = result.stdout.strip()
-        print(f"GID: {gid}")
+        out.append(f"GID: {gid}")
         assert gid == "65534", f"Expected GID 65534 (nobody), got {gid}"
 
 
-async def example_combined():
+async def example_combined(out: list[str]):
     """Example 5: Combine CMD and user overrides.
 
     A production-like setup: run as non-root with custom arguments.
     """
-    print("\n=== Example 5: Combined CMD + User ===")
+    out.append("\n=== Example 5: Combined CMD + User ===")
 
     async with boxlite.SimpleBox(
         image="python:alpine",
@@ -140,12 +140,12 @@ async def example_combined():
         cmd=["-c", "import os; print(f'uid={os.getuid()}, gid={os.getgid()}')"],
         user="1000:1000",
     ) as box:
-        print(f"Container started: {box.id}")
+        out.append(f"Container started: {box.id}")
 
         result = await box.exec(
             "python3", "-c", "import os; print(f'Running as uid={os.getuid()}')"
         )
-        print(f"Output: {result.stdout.strip()}")
+        out.append(f"Output: {result.stdout.strip()}")
 
 
 async def main():
@@ -153,11 +153,30 @@ async def main():
     print("BoxLite CMD and User Override Example")
     print("=" * 40)
 
-    await example_cmd_override()
-    await example_user_override()
-    await example_username_resolution()
-    await example_user_group_resolution()
-    await example_combined()
+    # The boxes are independent, so boot them concurrently. Each example
+    # collects its output so it can be printed in order afterwards.
+    examples = [
+        example_cmd_override,
+        example_user_override,
+        example_username_resolution,
+        example_user_group_resolution,
+        example_combined,
+    ]
+    outputs = [[] for _ in examples]
+    results = await asyncio.gather(
+        *(example(out) for example, out in zip(examples, outputs)),
+        return_exceptions=True,
+    )
+
+    failures = []
+    for example, out, result in zip(examples, outputs, results):
+        for line in out:
+            print(line)
+        if isinstance(result, BaseException):
+            print(f"{example.__name__} failed: {result!r}")
+            failures.append(result)
+    if failures:
+        raise failures[0]
 
     print("\nAll examples completed successfully!")
 
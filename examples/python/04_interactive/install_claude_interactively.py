@@ -36,6 +36,13 @@ BOX_ID = os.environ.get("BOXLITE_CLAUDE_BOX_ID", "")
 IMAGE = os.environ.get("BOXLITE_CLAUDE_IMAGE", "debian:bookworm-slim")
 OAUTH_TOKEN = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
 
+# Max bytes forwarded from the local terminal per read (one pipe buffer)
+STDIN_READ_SIZE = 64 * 1024
+
+# Box output is batched up to this size, or until the stream is idle this long
+OUTPUT_BATCH_SIZE = 64 * 1024
+OUTPUT_FLUSH_DELAY = 0.01
+
 
 def print_install_instructions():
     print("Inside the box, run:")
@@ -55,81 +62,126 @@ async def run_interactive_shell(box, env, shell="/bin/bash"):
     except TypeError:
         # Fallback for older SDKs without tty parameter
         execution = await box.exec(shell, [], env)
-    stdin = execution.stdin()
-    stdout = execution.stdout()
-    stderr = execution.stderr()
 
-    if not sys.stdin.isatty():
+    # Nothing to forward without a terminal; don't take the streams at all
+    if sys.stdin is None or not sys.stdin.isatty():
         await execution.wait()
         return
 
-    old_tty_settings = termios.tcgetattr(sys.stdin.fileno())
-    tty.setraw(sys.stdin.fileno(), when=termios.TCSANOW)
+    stdin_fd = sys.stdin.fileno()
+    stdin = execution.stdin()
+    stdout = execution.stdout()
+    stderr = execution.stderr()
+
+    old_tty_settings = termios.tcgetattr(stdin_fd)
+    tty.setraw(stdin_fd, when=termios.TCSANOW)
     exited = asyncio.Event()
+    stdin_chunks = asyncio.Queue()
 
     async def forward_stdin():
+        loop = asyncio.get_running_loop()
+        fd = stdin_fd
+
+        def on_readable():
+            # Called on the event loop when the tty has input; one read returns
+            # everything already buffered (up to 64 KiB).
+            try:
+                data = os.read(fd, STDIN_READ_SIZE)
+            except OSError:
+                data = b""
+            if not data:
+                loop.remove_reader(fd)
+            stdin_chunks.put_nowait(data)
+
+        loop.add_reader(fd, on_readable)
         try:
-            loop = asyncio.get_event_loop()
             while not exited.is_set():
-                try:
-                    read_task = loop.run_in_executor(
-                        None, os.read, sys.stdin.fileno(), 1024
-                    )
-                    done, pending = await asyncio.wait(
-                        [
-                            asyncio.ensure_future(read_task),
-                            asyncio.ensure_future(exited.wait()),
-                        ],
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                    for task in pending:
-                        task.cancel()
-                    if exited.is_set():
-                        break
-                    for task in done:
-                        if task.exception() is None:
-                            data = task.result()
-                            if isinstance(data, bytes) and data:
-                                await stdin.send_input(data)
-                            elif not data:
-                                return
-                except asyncio.CancelledError:
-                    break
+                data = await stdin_chunks.get()
+                if not data:
+                    # EOF on the local terminal, or the shell exited
+                    return
+                await stdin.send_input(data)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logger.error(f"Caught exception on stdin: {e}")
+        finally:
+            loop.remove_reader(fd)
 
-    async def forward_output(stream, target):
+    async def forward_output(stream, write, flush):
+        # Coalesce chunks that arrive in quick succession (bursty PTY output)
+        # into one write + flush; flush as soon as the stream goes quiet for
+        # OUTPUT_FLUSH_DELAY so prompts and keystroke echo are not held back.
+        chunks = stream.__aiter__()
+        pending = None
+        buf = bytearray()
         try:
-            async for chunk in stream:
-                if isinstance(chunk, bytes):
-                    target.buffer.write(chunk)
-                else:
-                    target.buffer.write(chunk.encode("utf-8", errors="replace"))
-                target.buffer.flush()
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(chunks.__anext__())
+                if buf:
+                    done, _ = await asyncio.wait({pending}, timeout=OUTPUT_FLUSH_DELAY)
+                    if not done:
+                        write(buf)
+                        flush()
+                        buf.clear()
+                        continue
+                try:
+                    chunk = await pending
+                except StopAsyncIteration:
+                    break
+                pending = None
+                # Chunks arrive as str; bytes are appended as is
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8", errors="replace")
+                buf += chunk
+                if len(buf) >= OUTPUT_BATCH_SIZE:
+                    write(buf)
+                    flush()
+                    buf.clear()
         except asyncio.CancelledError:
             # Task was cancelled as part of normal shutdown; no action needed.
             pass
         except Exception as e:
             logger.error(f"Error forwarding output: {e}")
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if buf:
+                write(buf)
+                flush()
 
     async def wait_for_exit():
         try:
             await execution.wait()
         finally:
             exited.set()
+            # Wake forward_stdin() if it is waiting for input
+            stdin_chunks.put_nowait(b"")
+
+    # Bound once so the per-chunk path skips the attribute lookups
+    stdout_buffer = sys.stdout.buffer
+    stderr_buffer = sys.stderr.buffer
 
+    tasks = [
+        asyncio.create_task(forward_stdin()),
+        asyncio.create_task(
+            forward_output(stdout, stdout_buffer.write, stdout_buffer.flush)
+        ),
+        asyncio.create_task(
+            forward_output(stderr, stderr_buffer.write, stderr_buffer.flush)
+        ),
+        asyncio.create_task(wait_for_exit()),
+    ]
     try:
-        await asyncio.gather(
-            forward_stdin(),
-            forward_output(stdout, sys.stdout),
-            forward_output(stderr, sys.stderr),
-            wait_for_exit(),
-            return_exceptions=True,
-        )
+        await asyncio.wait(tasks)
     finally:
-        termios.tcsetattr(
-            sys.stdin.fileno(), termios.TCSADRAIN, old_tty_settings
-        )
+        # Make sure no forwarding task outlives the session (e.g. on Ctrl+C)
+        # before the terminal settings are restored.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_tty_settings)
 
 
 async def main():
@@ -23,6 +23,7 @@ Run with:
 
 import asyncio
 import logging
+import sys
 
 from boxlite.orchestration import BoxRuntime
 
@@ -33,6 +34,33 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
+# Simulated AI code generation: the coder's payload, defined once at module
+# scope and shipped to the coder box with its task.
+GENERATED_CODE = """
+def fibonacci(n):
+    if n <= 0:
+        return 0
+    elif n == 1:
+        return 1
+    else:
+        a, b = 0, 1
+        for _ in range(2, n + 1):
+            a, b = b, a + b
+        return b
+"""
+
+TEST_CODE = """
+assert fibonacci(0) == 0, "fib(0) should be 0"
+assert fibonacci(1) == 1, "fib(1) should be 1"
+assert fibonacci(10) == 55, "fib(10) should be 55"
+assert fibonacci(20) == 6765, "fib(20) should be 6765"
+"""
+
+# Tester-side cache of compiled submissions, so re-running identical code and
+# tests skips the parse/compile pass. Shipped to the tester box along with
+# its handler and lives as long as the tester process.
+_code_cache = {}
+
 
 async def main():
     print("=" * 70)
@@ -43,9 +71,12 @@ async def main():
 
     async with BoxRuntime() as runtime:
         print("[host] Creating agent boxes...")
-        coder = await runtime.create_box(name="coder", memory_mib=512)
-        reviewer = await runtime.create_box(name="reviewer", memory_mib=512)
-        tester = await runtime.create_box(name="tester", memory_mib=512)
+        # Boot the three VMs concurrently rather than one after another
+        coder, reviewer, tester = await asyncio.gather(
+            runtime.create_box(name="coder", memory_mib=512),
+            runtime.create_box(name="reviewer", memory_mib=512),
+            runtime.create_box(name="tester", memory_mib=512),
+        )
         print(f"[host] Created: {runtime.list_boxes()}")
         print()
 
@@ -54,7 +85,8 @@ async def main():
         # ====================================================================
         @reviewer.on_message
         def handle_review(sender, data):
-            import sys
+            # sys comes from module scope (cloudpickle re-imports it by name);
+            # boxlite_runtime only exists inside the guest, so import it here.
             from boxlite_runtime import send_message
 
             action = data.get("action")
@@ -94,8 +126,6 @@ async def main():
 
         @reviewer.on_event("pipeline_complete")
         def reviewer_on_complete(data):
-            import sys
-
             print(
                 f"[reviewer] Pipeline complete: {data.get('status')}", file=sys.stderr
             )
@@ -105,8 +135,6 @@ async def main():
         # ====================================================================
         @tester.on_message
         def handle_test(sender, data):
-            import sys
-
             action = data.get("action")
             if action == "test":
                 code = data.get("code", "")
@@ -118,7 +146,11 @@ async def main():
 
                 namespace = {}
                 try:
-                    exec(full_code, namespace)
+                    compiled = _code_cache.get(full_code)
+                    if compiled is None:
+                        compiled = compile(full_code, "<pipeline>", "exec")
+                        _code_cache[full_code] = compiled
+                    exec(compiled, namespace)
                     print("[tester] All tests passed!", file=sys.stderr)
                     return {"passed": True, "output": "All tests passed"}
                 except AssertionError as e:
@@ -132,8 +164,6 @@ async def main():
 
         @tester.on_event("pipeline_complete")
         def tester_on_complete(data):
-            import sys
-
             status = data.get("status", "unknown")
             if status == "success":
                 print("[tester] Pipeline succeeded!", file=sys.stderr)
@@ -147,7 +177,6 @@ async def main():
         # ====================================================================
         @coder.task
         def coder_main():
-            import sys
             from boxlite_runtime import send_message, publish_event
 
             print("[coder] Starting code generation agent...", file=sys.stderr)
@@ -155,34 +184,13 @@ async def main():
             task = "fibonacci function"
             print(f"[coder] Generating code for: {task}", file=sys.stderr)
 
-            # Simulated AI code generation
-            generated_code = """
-def fibonacci(n):
-    if n <= 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
-"""
-
-            test_code = """
-assert fibonacci(0) == 0, "fib(0) should be 0"
-assert fibonacci(1) == 1, "fib(1) should be 1"
-assert fibonacci(10) == 55, "fib(10) should be 55"
-assert fibonacci(20) == 6765, "fib(20) should be 6765"
-"""
-
             print("[coder] Sending code to reviewer...", file=sys.stderr)
             review_result = send_message(
                 "reviewer",
                 {
                     "action": "review",
-                    "code": generated_code,
-                    "tests": test_code,
+                    "code": GENERATED_CODE,
+                    "tests": TEST_CODE,
                     "task": task,
                 },
             )
@@ -206,11 +214,10 @@ assert fibonacci(20) == 6765, "fib(20) should be 6765"
 
         # Start agents
         print("[host] Starting receiver agents...")
-        await reviewer.run()
-        await tester.run()
+        await asyncio.gather(reviewer.run(), tester.run())
 
-        # Give receivers time to initialize
-        await asyncio.sleep(0.5)
+        # Wait until both receivers are accepting messages
+        await asyncio.gather(reviewer.ready(), tester.ready())
 
         print("[host] Starting coder agent (initiates pipeline)...")
         print()
@@ -9,20 +9,29 @@ The boxlite_runtime module is automatically injected by BoxRuntime.
 """
 
 from boxlite_runtime import on_message, on_event, run_forever
-import sys
 import os
+import sys
 
 BOX_NAME = os.environ.get("BOXLITE_BOX_NAME", "unknown")
 
+# Static parts of the per-message log lines, built once
+_RECV_PREFIX = f"[{BOX_NAME}] Received '"
+_PIPELINE_PREFIX = f"[{BOX_NAME}] Pipeline complete event: "
+_SHUTDOWN_PREFIX = f"[{BOX_NAME}] Shutdown requested: "
+
 
 def fibonacci(n: int) -> int:
-    """Compute fibonacci number."""
-    if n <= 1:
+    """Compute fibonacci number by fast doubling (O(log n) steps)."""
+    if n < 0:
         return n
+    # Walk the bits of n from the top, keeping (F(k), F(k+1)):
+    #   F(2k) = F(k) * (2*F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
     a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+    return a
 
 
 @on_message
@@ -34,38 +43,34 @@ def handle_message(sender: str, data: dict) -> dict:
     The return value is sent back as the response.
     """
     task = data.get("task")
-    print(f"[{BOX_NAME}] Received '{task}' from {sender}: {data}", file=sys.stderr)
+    print(_RECV_PREFIX, task, "' from ", sender, ": ", data, sep="", file=sys.stderr)
 
     if task == "compute":
         operation = data.get("operation")
         if operation == "fibonacci":
             n = data.get("n", 10)
-            result = fibonacci(n)
-            return {"operation": operation, "n": n, "result": result}
-        else:
-            return {"error": f"unknown operation: {operation}"}
+            return {"operation": operation, "n": n, "result": fibonacci(n)}
+        return {"error": f"unknown operation: {operation}"}
 
-    elif task == "double":
-        value = data.get("value", 0)
-        return {"doubled": value * 2}
+    if task == "double":
+        return {"doubled": data.get("value", 0) * 2}
 
-    elif task == "echo":
+    if task == "echo":
         return {"echo": data}
 
-    else:
-        return {"error": f"unknown task: {task}"}
+    return {"error": f"unknown task: {task}"}
 
 
 @on_event("pipeline_complete")
 def on_pipeline_complete(data: dict) -> None:
     """Handle pipeline completion events."""
-    print(f"[{BOX_NAME}] Pipeline complete event: {data}", file=sys.stderr)
+    print(_PIPELINE_PREFIX, data, sep="", file=sys.stderr)
 
 
 @on_event("shutdown_requested")
 def on_shutdown(data: dict) -> None:
     """Handle shutdown request events."""
-    print(f"[{BOX_NAME}] Shutdown requested: {data}", file=sys.stderr)
+    print(_SHUTDOWN_PREFIX, data, sep="", file=sys.stderr)
     # Note: The event loop will exit when stdin is closed
 
 
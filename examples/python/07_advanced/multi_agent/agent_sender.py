@@ -9,18 +9,34 @@ The boxlite_runtime module is automatically injected by BoxRuntime.
 """
 
 from boxlite_runtime import send_message, publish_event
-import sys
+import atexit
 import os
+import sys
 
 BOX_NAME = os.environ.get("BOXLITE_BOX_NAME", "unknown")
 
+# Block-buffer diagnostics so each print is not its own write() syscall;
+# they are flushed at exit, or before an uncaught traceback so they keep
+# their order. Set BOXLITE_AGENT_UNBUFFERED=1 to see lines live.
+if os.environ.get("BOXLITE_AGENT_UNBUFFERED"):
+    _stderr = sys.stderr
+else:
+    _stderr = open(sys.stderr.fileno(), "w", buffering=8192, closefd=False)
+    atexit.register(_stderr.flush)
+
+    def _flush_then_report(*exc_info, _report=sys.excepthook):
+        _stderr.flush()
+        _report(*exc_info)
+
+    sys.excepthook = _flush_then_report
+
 
 def main():
-    print(f"[{BOX_NAME}] Agent starting...", file=sys.stderr)
+    print(f"[{BOX_NAME}] Agent starting...", file=_stderr)
 
     # Point-to-point messaging
     # Send a computation request to worker-b
-    print(f"[{BOX_NAME}] Sending compute request to worker-b...", file=sys.stderr)
+    print(f"[{BOX_NAME}] Sending compute request to worker-b...", file=_stderr)
     result = send_message(
         "worker-b",
         {
@@ -29,10 +45,10 @@ def main():
             "n": 10,
         },
     )
-    print(f"[{BOX_NAME}] Received result: {result}", file=sys.stderr)
+    print(f"[{BOX_NAME}] Received result: {result}", file=_stderr)
 
     # Send another request
-    print(f"[{BOX_NAME}] Sending double request...", file=sys.stderr)
+    print(f"[{BOX_NAME}] Sending double request...", file=_stderr)
     result = send_message(
         "worker-b",
         {
@@ -40,10 +56,10 @@ def main():
             "value": 42,
         },
     )
-    print(f"[{BOX_NAME}] Doubled result: {result}", file=sys.stderr)
+    print(f"[{BOX_NAME}] Doubled result: {result}", file=_stderr)
 
     # Pub/Sub: Publish completion event
-    print(f"[{BOX_NAME}] Publishing completion event...", file=sys.stderr)
+    print(f"[{BOX_NAME}] Publishing completion event...", file=_stderr)
     publish_event(
         "pipeline_complete",
         {
@@ -53,7 +69,7 @@ def main():
         },
     )
 
-    print(f"[{BOX_NAME}] Agent finished!", file=sys.stderr)
+    print(f"[{BOX_NAME}] Agent finished!", file=_stderr)
 
 
 if __name__ == "__main__":
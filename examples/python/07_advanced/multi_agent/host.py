@@ -31,10 +31,14 @@ async def main():
     print()
 
     async with BoxRuntime() as runtime:
-        # Create two worker boxes
+        # Create two worker boxes (booted concurrently)
         print("[host] Creating boxes...")
-        worker_a = await runtime.create_box(name="worker-a", memory_mib=512)
-        worker_b = await runtime.create_box(name="worker-b", memory_mib=512)
+        worker_a, worker_b = await runtime.create_boxes(
+            [
+                {"name": "worker-a", "memory_mib": 512},
+                {"name": "worker-b", "memory_mib": 512},
+            ]
+        )
         print(f"[host] Created boxes: {runtime.list_boxes()}")
         print()
 
@@ -45,8 +49,6 @@ async def main():
         @worker_b.on_message
         def handle_message(sender, data):
             """Handle incoming point-to-point messages."""
-            import sys
-
             print(f"[agent_b] Received message from {sender}: {data}", file=sys.stderr)
 
             if data.get("task") == "double":
@@ -59,8 +61,6 @@ async def main():
         @worker_b.on_event("task_complete")
         def on_complete(data):
             """Handle task_complete events."""
-            import sys
-
             print(f"[agent_b] Received 'task_complete' event: {data}", file=sys.stderr)
 
         # ─────────────────────────────────────────────────────────────
@@ -70,8 +70,8 @@ async def main():
         @worker_a.task
         def agent_a_main():
             """One-shot task that sends messages and publishes events."""
-            import sys
-
+            # sys comes from module scope (cloudpickle re-imports it by name);
+            # boxlite_runtime only exists inside the guest, so import it here.
             from boxlite_runtime import publish_event, send_message
 
             print("[agent_a] Starting...", file=sys.stderr)
@@ -95,8 +95,8 @@ async def main():
         print("[host] Starting agent in worker-b (receiver)...")
         await worker_b.run()
 
-        # Give worker-b a moment to initialize
-        await asyncio.sleep(0.5)
+        # Wait until worker-b's message loop is accepting messages
+        await worker_b.ready()
 
         # Start worker-a (sender)
         print("[host] Starting agent in worker-a (sender)...")
@@ -108,15 +108,17 @@ async def main():
         exit_code = await worker_a.wait()
         print(f"[host] worker-a finished with exit code: {exit_code}")
 
-        # Stop worker-b (it runs forever, so we need to stop it)
+        # Stop worker-b (it runs forever, so we need to stop it). Nothing
+        # below depends on it, so let the teardown overlap the closing output.
         print("[host] Stopping worker-b...")
-        await worker_b.stop()
+        stop_task = asyncio.create_task(worker_b.stop())
 
         print()
         print("=" * 60)
         print("Demo complete!")
         print("=" * 60)
 
+        await stop_task
         return exit_code
 
 
@@ -14,9 +14,18 @@ Prerequisites:
 """
 
 import asyncio
+import os
+import sys
 
 from boxlite import Boxlite, BoxOptions, BoxliteRestOptions
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from _helpers import drain_stdout
+except ImportError:
+    async def drain_stdout(execution):
+        return (await execution.stdout().read()).splitlines()
+
 
 SERVER_URL = "http://localhost:8080"
 
@@ -51,13 +60,12 @@ async def main():
 
     # --- Environment variables ---
     print("\n=== Environment Variables ===")
-    await box.start()
+    # exec starts the box lazily, so no separate start() round trip
     run = await box.exec(
         "sh", args=["-c", "echo APP=$APP_NAME ENV=$APP_ENV"],
         env=[("APP_NAME", "boxlite-demo"), ("APP_ENV", "staging")],
     )
-    stdout = run.stdout()
-    async for line in stdout:
+    for line in await drain_stdout(run):
         print(f"  {line}")
     await run.wait()
 
@@ -69,11 +77,9 @@ async def main():
         auto_remove=False,
     )
     box_wd = await rt.create(opts_wd, name="workdir-demo")
-    await box_wd.start()
 
     run = await box_wd.exec("pwd")
-    stdout = run.stdout()
-    async for line in stdout:
+    for line in await drain_stdout(run):
         print(f"  Working dir: {line}")
     await run.wait()
 
@@ -86,8 +92,10 @@ async def main():
         print(f"  Status: {info_after_stop.state.status}")
 
     # --- Cleanup ---
-    await rt.remove(box.id, force=True)
-    await rt.remove(box_wd.id, force=True)
+    await asyncio.gather(
+        rt.remove(box.id, force=True),
+        rt.remove(box_wd.id, force=True),
+    )
     print(f"\n  Cleaned up boxes")
     print("\n  Done")
 
@@ -5,7 +5,7 @@ Upload files to a box via the REST API.
 Demonstrates:
 - box.copy_in() to upload files from host into the box rootfs
 - Files must be copied BEFORE starting the box (rootfs layer)
-- Verifying uploaded files via command execution
+- Verifying uploaded files by checksum in a single command
 
 Note: When uploading a directory, its CONTENTS are placed at the
 destination (not the directory itself). For example, uploading
@@ -17,11 +17,20 @@ Prerequisites:
 """
 
 import asyncio
+import hashlib
 import os
+import sys
 import tempfile
 
 from boxlite import Boxlite, BoxOptions, BoxliteRestOptions
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from _helpers import drain_stdout
+except ImportError:
+    async def drain_stdout(execution):
+        return (await execution.stdout().read()).splitlines()
+
 
 SERVER_URL = "http://localhost:8080"
 
@@ -56,21 +65,21 @@ async def main():
 
         print(f"  Created: {os.listdir(app_dir)}")
 
-        # --- Upload directory contents (before starting) ---
-        # Directory contents land at the destination path:
-        #   myapp/ contains hello.txt, config.json
-        #   copy_in(myapp, "/opt/app") -> /opt/app/hello.txt, /opt/app/config.json
-        print("\n=== Upload Directory (copy_in) ===")
-        await box.copy_in(app_dir, "/opt/app")
-        print("  Uploaded myapp/ contents -> /opt/app/")
-
-        # --- Upload a single file ---
-        print("\n=== Upload Single File ===")
         motd = os.path.join(tmpdir, "motd.txt")
         with open(motd, "w") as f:
             f.write("Welcome to BoxLite!\n")
 
-        await box.copy_in(motd, "/etc")
+        # --- Upload a directory and a single file (before starting) ---
+        # Directory contents land at the destination path:
+        #   myapp/ contains hello.txt, config.json
+        #   copy_in(myapp, "/opt/app") -> /opt/app/hello.txt, /opt/app/config.json
+        # The uploads are independent, so run them concurrently.
+        print("\n=== Upload Directory and Single File (copy_in) ===")
+        await asyncio.gather(
+            box.copy_in(app_dir, "/opt/app"),
+            box.copy_in(motd, "/etc"),
+        )
+        print("  Uploaded myapp/ contents -> /opt/app/")
         print("  Uploaded motd.txt -> /etc/motd.txt")
 
         # --- Start and verify ---
@@ -78,25 +87,27 @@ async def main():
         await box.start()
         print("  Box started")
 
-        # Verify directory upload
-        run = await box.exec("cat", args=["/opt/app/hello.txt"])
-        stdout = run.stdout()
-        async for line in stdout:
-            print(f"  /opt/app/hello.txt: {line}")
-        await run.wait()
-
-        run = await box.exec("cat", args=["/opt/app/config.json"])
-        stdout = run.stdout()
-        async for line in stdout:
-            print(f"  /opt/app/config.json: {line}")
-        await run.wait()
-
-        # Verify single file upload
-        run = await box.exec("cat", args=["/etc/motd.txt"])
-        stdout = run.stdout()
-        async for line in stdout:
-            print(f"  /etc/motd.txt: {line}")
-        await run.wait()
+        # Verify all uploads with one exec: hash the host copies locally
+        # and compare against sha256sum of the uploaded files
+        uploaded = {
+            "/opt/app/hello.txt": os.path.join(app_dir, "hello.txt"),
+            "/opt/app/config.json": os.path.join(app_dir, "config.json"),
+            "/etc/motd.txt": motd,
+        }
+        run = await box.exec("sha256sum", args=list(uploaded))
+        missing = set(uploaded)
+        for line in await drain_stdout(run):
+            digest, path = line.split(maxsplit=1)
+            missing.discard(path)
+            with open(uploaded[path], "rb") as f:
+                expected = hashlib.sha256(f.read()).hexdigest()
+            print(f"  {path}: {'ok' if digest == expected else 'MISMATCH'}")
+        # sha256sum reports unreadable files on stderr only
+        result = await run.wait()
+        for path in sorted(missing):
+            print(f"  {path}: MISSING")
+        if result.exit_code != 0:
+            print(f"  sha256sum exited with code {result.exit_code}")
 
     # --- Cleanup ---
     await rt.remove(box.id, force=True)
@@ -42,26 +42,29 @@ async def main():
     box_id = box.id
     print(f"  Created box: {box_id}")
 
+    # The lookups below only read state, so issue them together and
+    # print the results in order
+    info, handle, (box2, created), all_boxes = await asyncio.gather(
+        rt.get_info(box_id),
+        rt.get("rest-crud-demo"),
+        rt.get_or_create(BoxOptions(image="alpine:latest"), name="rest-crud-demo"),
+        rt.list_info(),
+    )
+
     # --- Get by ID ---
     print("\n=== Get Info by ID ===")
-    info = await rt.get_info(box_id)
     print(f"  Found: id={info.id}  name={info.name}  status={info.state.status}")
 
     # --- Get handle by name ---
     print("\n=== Get Handle by Name ===")
-    handle = await rt.get("rest-crud-demo")
     print(f"  Found by name: {handle.id}")
 
     # --- Get or Create (idempotent) ---
     print("\n=== Get or Create ===")
-    box2, created = await rt.get_or_create(
-        BoxOptions(image="alpine:latest"), name="rest-crud-demo",
-    )
     print(f"  id={box2.id}  newly_created={created}")
 
     # --- List ---
     print("\n=== List ===")
-    all_boxes = await rt.list_info()
     print(f"  Total boxes: {len(all_boxes)}")
     for b in all_boxes:
         marker = " <-- ours" if str(b.id) == str(box_id) else ""
@@ -12,9 +12,18 @@ Prerequisites:
 """
 
 import asyncio
+import os
+import sys
 
 from boxlite import Boxlite, BoxOptions, BoxliteRestOptions
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from _helpers import drain_stdout
+except ImportError:
+    async def drain_stdout(execution):
+        return (await execution.stdout().read()).splitlines()
+
 
 SERVER_URL = "http://localhost:8080"
 
@@ -47,19 +56,18 @@ async def main():
     box = await rt.create(opts, name="metrics-demo")
     print(f"  Created box: {box.id}")
 
-    await box.start()
-    print("  Box started")
-
+    # exec starts the box lazily, so no separate start() round trip
     run = await box.exec("echo", args=["hello metrics"])
-    stdout = run.stdout()
-    async for line in stdout:
+    for line in await drain_stdout(run):
         print(f"  stdout: {line}")
     result = await run.wait()
     print(f"  exit_code: {result.exit_code}")
 
+    # Box and runtime metrics are independent reads; fetch them together
+    bm, rm2 = await asyncio.gather(box.metrics(), rt.metrics())
+
     # --- Per-box metrics ---
     print("\n=== Box Metrics ===")
-    bm = await box.metrics()
     print(f"  commands_executed_total:   {bm.commands_executed_total}")
     print(f"  exec_errors_total:        {bm.exec_errors_total}")
     print(f"  bytes_sent_total:         {bm.bytes_sent_total}")
@@ -71,7 +79,6 @@ async def main():
 
     # --- Runtime metrics (after work) ---
     print("\n=== Runtime Metrics (after work) ===")
-    rm2 = await rt.metrics()
     print(f"  boxes_created_total:      {rm2.boxes_created_total}")
     print(f"  total_commands_executed:   {rm2.total_commands_executed}")
 
@@ -15,9 +15,18 @@ Prerequisites:
 """
 
 import asyncio
+import os
+import sys
 
 from boxlite import Boxlite, BoxOptions, BoxliteRestOptions
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from _helpers import drain_stdout
+except ImportError:
+    async def drain_stdout(execution):
+        return (await execution.stdout().read()).splitlines()
+
 
 SERVER_URL = "http://localhost:8080"
 
@@ -35,17 +44,16 @@ async def main():
 
     rt = connect()
 
-    # Create and start a box
+    # Create a box; the server starts it on the first exec, which saves
+    # a separate start round trip
     opts = BoxOptions(image="alpine:latest", auto_remove=False)
     box = await rt.create(opts, name="exec-demo")
-    await box.start()
-    print(f"  Box {box.id} started")
+    print(f"  Box {box.id} created")
 
     # --- Simple command ---
     print("\n=== Simple Command ===")
     execution = await box.exec("echo", args=["hello from REST API"])
-    stdout = execution.stdout()
-    async for line in stdout:
+    for line in await drain_stdout(execution):
         print(f"  stdout: {line}")
     result = await execution.wait()
     print(f"  exit_code: {result.exit_code}")
@@ -53,8 +61,7 @@ async def main():
     # --- Command with arguments ---
     print("\n=== Command with Arguments ===")
     execution = await box.exec("ls", args=["-la", "/"])
-    stdout = execution.stdout()
-    async for line in stdout:
+    for line in await drain_stdout(execution):
         print(f"  {line}")
     await execution.wait()
 
@@ -63,6 +70,7 @@ async def main():
     execution = await box.exec(
         "sh", args=["-c", "for i in 1 2 3; do echo \"line $i\"; done"],
     )
+    # Iterate the stream here to show output as it arrives
     stdout = execution.stdout()
     count = 0
     async for line in stdout:
@@ -83,8 +91,7 @@ async def main():
         "sh", args=["-c", "echo GREETING=$GREETING"],
         env=[("GREETING", "hello-from-rest")],
     )
-    stdout = execution.stdout()
-    async for line in stdout:
+    for line in await drain_stdout(execution):
         print(f"  {line}")
     await execution.wait()
 
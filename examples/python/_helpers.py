@@ -15,3 +15,12 @@ def setup_logging(level: int = logging.ERROR) -> None:
         format="%(asctime)s [%(levelname)s] %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)],
     )
+
+
+async def drain_stdout(execution) -> list[str]:
+    """Read an execution's entire stdout and return it split into lines.
+
+    Uses a single ``read()`` await rather than one await per streamed chunk.
+    """
+    output = await execution.stdout().read()
+    return output.splitlines()
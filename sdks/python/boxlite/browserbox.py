@@ -27,6 +27,7 @@ These modes are MUTUALLY EXCLUSIVE - use one or the other per instance.
 """
 
 import asyncio
+import math
 import time
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING, Any
@@ -47,8 +48,11 @@ __all__ = ["BrowserBox", "BrowserBoxOptions"]
 # Default CDP port for remote debugging (Chromium CDP / Firefox BiDi)
 _CDP_PORT = 9222
 
-# Polling interval for service readiness checks (seconds)
-_POLL_INTERVAL = 0.5
+# Browser types supported by BrowserBoxOptions.browser
+_BROWSERS = frozenset({"chromium", "firefox", "webkit"})
+
+# Polling interval for service readiness checks, run inside the VM (seconds)
+_POLL_INTERVAL = 0.1
 
 # Log file paths inside the VM
 _PLAYWRIGHT_LOG = "/tmp/playwright.log"
@@ -143,8 +147,15 @@ class BrowserBox(SimpleBox):
             options: Browser configuration (uses defaults if None)
             runtime: Optional runtime instance (uses global default if None)
             **kwargs: Additional configuration options (volumes, env, ports, etc.)
+
+        Raises:
+            ValueError: If options.browser is not a supported browser type
         """
         opts = options or BrowserBoxOptions()
+        # Reject unknown browsers before a VM is created; later code only
+        # branches on the supported names.
+        if opts.browser not in _BROWSERS:
+            raise ValueError(f"Unknown browser type: {opts.browser}")
 
         self._browser = opts.browser
         # Guest port: where Playwright Server listens inside VM (fixed)
@@ -210,13 +221,19 @@ class BrowserBox(SimpleBox):
         Raises:
             TimeoutError: If service doesn't become ready within timeout
         """
-        start = time.time()
-
-        while time.time() - start < timeout:
-            result = await self.exec("sh", "-c", check_cmd)
-            if result.stdout.strip() == "ready":
-                return
-            await asyncio.sleep(_POLL_INTERVAL)
+        # Loop inside the guest so readiness is noticed within _POLL_INTERVAL,
+        # rather than paying an exec round trip per probe. Shell arithmetic
+        # is integer-only, so round a float timeout up.
+        poll_cmd = (
+            f"end=$(($(date +%s) + {int(math.ceil(timeout))})); "
+            f"while [ $(date +%s) -lt $end ]; do "
+            f'[ "$({check_cmd})" = ready ] && echo ready && exit 0; '
+            f"sleep {_POLL_INTERVAL}; "
+            f"done; echo notready"
+        )
+        result = await self.exec("sh", "-c", poll_cmd)
+        if result.stdout.strip() == "ready":
+            return
 
         # Fetch log content for debugging
         log_content = ""
@@ -609,12 +626,7 @@ while True:
             )
 
         pw = await async_playwright().start()
-        browser_type = getattr(pw, self._browser, None)
-
-        if browser_type is None:
-            raise ValueError(f"Unknown browser type: {self._browser}")
-
-        return await browser_type.connect(ws)
+        return await getattr(pw, self._browser).connect(ws)
 
     @property
     def browser(self) -> str:
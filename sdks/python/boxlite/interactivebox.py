@@ -196,42 +196,41 @@ class InteractiveBox(SimpleBox):
 
             # Forward stdin in chunks
             loop = asyncio.get_event_loop()
-            while not self._exited.is_set():
-                # Read from stdin with timeout to check exit event
-                try:
-                    read_task = loop.run_in_executor(
-                        None, os.read, sys.stdin.fileno(), 1024
-                    )
-                    # Wait for either stdin data or exit event
-                    done, pending = await asyncio.wait(
-                        [
-                            asyncio.ensure_future(read_task),
-                            asyncio.ensure_future(self._exited.wait()),
-                        ],
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
-
-                    # Check if we exited
-                    if self._exited.is_set():
-                        logger.info("Closing interactive shell (stdin forwarding).")
-                        break
-
-                    # Get the data from completed read task
-                    for task in done:
-                        if task.exception() is None:
-                            data = task.result()
+            # One exit waiter for the whole session rather than one per read
+            exit_wait = asyncio.ensure_future(self._exited.wait())
+            try:
+                while not self._exited.is_set():
+                    # Read from stdin with timeout to check exit event
+                    try:
+                        # run_in_executor already returns a future usable by wait()
+                        read_task = loop.run_in_executor(
+                            None, os.read, sys.stdin.fileno(), 1024
+                        )
+                        # Wait for either stdin data or exit event
+                        await asyncio.wait(
+                            [read_task, exit_wait],
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+
+                        # Check if we exited
+                        if self._exited.is_set():
+                            read_task.cancel()
+                            logger.info("Closing interactive shell (stdin forwarding).")
+                            break
+
+                        # Get the data from completed read task
+                        if read_task.exception() is None:
+                            data = read_task.result()
                             if isinstance(data, bytes) and data:
                                 await self._stdin.send_input(data)
                             elif not data:
                                 # EOF
                                 return
 
-                except asyncio.CancelledError:
-                    break
+                    except asyncio.CancelledError:
+                        break
+            finally:
+                exit_wait.cancel()
 
         except asyncio.CancelledError:
             logger.info("Cancelling interactive shell (stdin forwarding).")
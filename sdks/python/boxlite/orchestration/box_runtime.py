@@ -4,6 +4,7 @@ BoxRuntime - Multi-box orchestration with Ray-style decorator API.
 
 import asyncio
 import base64
+import itertools
 import json
 import sys
 from typing import Any, Callable, Optional
@@ -12,8 +13,46 @@ import cloudpickle
 
 from ..simplebox import SimpleBox
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = ["BoxRuntime", "ManagedBox"]
 
+# Guest entry point, run as `python3 -c _GUEST_BOOTSTRAP <payload>`. The
+# base64 handler payload arrives as argv[1], so the source never changes
+# and needs no quoting. Events a task published are flushed as soon as it
+# returns rather than at interpreter exit.
+_GUEST_BOOTSTRAP = """
+import base64, sys, cloudpickle
+from boxlite_runtime import on_message, on_event, run_forever, _flush
+_d = cloudpickle.loads(base64.b64decode(sys.argv[1]))
+for _h in _d["message_handlers"]: on_message(_h)
+for _e, _hs in _d["event_handlers"].items():
+    for _h in _hs: on_event(_e)(_h)
+if _d["task"]: _d["task"](); _flush()
+if _d["message_handlers"] or _d["event_handlers"]: run_forever()
+"""
+
+
+def _encode(msg: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                msg, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which json handles
+    return (json.dumps(msg) + "\n").encode()
+
+
+# How long wait() lets the message pump reach EOF after the guest exits
+_PUMP_DRAIN_TIMEOUT = 5.0
+
+# The shutdown notice never varies, so it is encoded once
+_SHUTDOWN_FRAME = _encode({"type": "shutdown"})
+
 
 class ManagedBox:
     """Box with messaging runtime and decorator-based handler registration."""
@@ -25,9 +64,14 @@ class ManagedBox:
         self._box: Optional[SimpleBox] = None
         self._execution = None
         self._stdin = None
+        self._outbox = bytearray()
+        self._flushing: Optional[asyncio.Future] = None
         self._stdout = None
         self._pump_task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Future] = None
+        self._ready: Optional[asyncio.Future] = None
         self._pending: dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count()
         self._task_func: Optional[Callable] = None
         self._message_handlers: list[Callable] = []
         self._event_handlers: dict[str, list[Callable]] = {}
@@ -51,15 +95,25 @@ class ManagedBox:
     async def _inject_sdk(self) -> None:
         from importlib.resources import files, as_file
 
-        result = await self._box.exec("pip", "install", "-q", "cloudpickle")
-        if result.exit_code != 0:
-            raise RuntimeError(f"Failed to install cloudpickle: {result.stderr}")
         site_packages = (
             f"/usr/local/lib/python{self._runtime._python_version}/site-packages"
         )
         sdk_file = files("boxlite.orchestration.guest").joinpath("boxlite_runtime.py")
         with as_file(sdk_file) as path:
-            await self._box.copy_in(str(path), site_packages, include_parent=False)
+            # Copying the runtime module does not depend on cloudpickle being
+            # installed, so overlap the two. Images that already ship
+            # cloudpickle skip pip entirely.
+            result, _ = await asyncio.gather(
+                self._box.exec(
+                    "sh",
+                    "-c",
+                    "python3 -c 'import cloudpickle' 2>/dev/null"
+                    " || pip install -q cloudpickle",
+                ),
+                self._box.copy_in(str(path), site_packages, include_parent=False),
+            )
+        if result.exit_code != 0:
+            raise RuntimeError(f"Failed to install cloudpickle: {result.stderr}")
 
     def task(self, func: Callable) -> Callable:
         """Register one-shot task to run before event loop."""
@@ -93,58 +147,90 @@ class ManagedBox:
         if self._execution:
             raise RuntimeError("Already running")
 
-        code = self._generate_code()
+        payload = self._payload()
         script_env = {"BOXLITE_BOX_NAME": self._name}
         if env:
             script_env.update(env)
 
         self._execution = await self._box._box.exec(
-            "python3", ["-c", code], list(script_env.items())
+            "python3", ["-c", _GUEST_BOOTSTRAP, payload], list(script_env.items())
         )
         self._stdin = self._execution.stdin()
         self._stdout = self._execution.stdout()
+        self._ready = asyncio.get_running_loop().create_future()
         self._pump_task = asyncio.create_task(self._message_pump())
 
-    def _generate_code(self) -> str:
+    async def ready(self, timeout: float = 30.0) -> None:
+        """Wait until the guest's message loop is accepting messages.
+
+        Only boxes with message or event handlers signal readiness; a box
+        that just runs a task never does.
+        """
+        if not self._ready:
+            raise RuntimeError("Not running")
+        try:
+            await asyncio.wait_for(asyncio.shield(self._ready), timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Timeout waiting for {self._name} to be ready")
+        except asyncio.CancelledError:
+            if self._ready.cancelled():
+                raise RuntimeError(f"Box {self._name} exited before ready")
+            raise
+
+    def _payload(self) -> str:
         data = {
             "task": self._task_func,
             "message_handlers": self._message_handlers,
             "event_handlers": self._event_handlers,
         }
-        payload = base64.b64encode(cloudpickle.dumps(data)).decode()
-        return f'''
-import cloudpickle, base64
-from boxlite_runtime import on_message, on_event, run_forever
-_d = cloudpickle.loads(base64.b64decode("{payload}"))
-for _h in _d["message_handlers"]: on_message(_h)
-for _e, _hs in _d["event_handlers"].items():
-    for _h in _hs: on_event(_e)(_h)
-if _d["task"]: _d["task"]()
-if _d["message_handlers"] or _d["event_handlers"]: run_forever()
-'''
+        # Stdlib pickle would store handlers by module + name, which the guest
+        # cannot import (they usually live in the host's __main__); cloudpickle
+        # ships them by value. Pickled per run() so closures and globals are
+        # captured as they are now.
+        return base64.b64encode(cloudpickle.dumps(data)).decode()
 
     async def _message_pump(self) -> None:
+        # The guest may batch several messages into one write, and a chunk
+        # can end mid-line, so carry the partial tail over to the next chunk
+        pending = ""
         try:
-            async for line in self._stdout:
-                if isinstance(line, bytes):
-                    line = line.decode("utf-8", errors="replace")
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    msg = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                msg_type = msg.get("type")
-                if msg_type == "send":
-                    await self._handle_send(msg)
-                elif msg_type == "publish":
-                    await self._handle_publish(msg)
-                elif msg_type == "response":
-                    self._handle_response(msg)
+            async for chunk in self._stdout:
+                if isinstance(chunk, bytes):
+                    chunk = chunk.decode("utf-8", errors="replace")
+                if pending:
+                    chunk = pending + chunk
+                *lines, pending = chunk.split("\n")
+                for line in lines:
+                    await self._handle_line(line)
         except asyncio.CancelledError:
             pass
+        finally:
+            if self._ready and not self._ready.done():
+                self._ready.cancel()
+
+    async def _handle_line(self, line: str) -> None:
+        # The guest writes each frame at the start of a line, so blank lines
+        # and stray prints are skipped without a copy or a failed parse.
+        # json.loads itself tolerates the trailing whitespace.
+        if not line.startswith("{"):
+            return
+        try:
+            msg = json.loads(line)
+        except json.JSONDecodeError:
+            return
+
+        msg_type = msg.get("type")
+        if msg_type == "send":
+            await self._handle_send(msg)
+        elif msg_type == "send_many":
+            await self._handle_send_many(msg)
+        elif msg_type == "publish":
+            await self._handle_publish(msg)
+        elif msg_type == "response":
+            self._handle_response(msg)
+        elif msg_type == "ready":
+            if not self._ready.done():
+                self._ready.set_result(None)
 
     async def _handle_send(self, msg: dict) -> None:
         request_id, target, data = (
@@ -153,25 +239,57 @@ if _d["message_handlers"] or _d["event_handlers"]: run_forever()
             msg.get("data"),
         )
         try:
-            target_box = self._runtime._boxes.get(target)
-            if not target_box:
-                raise ValueError(f"Box '{target}' not found")
-            if target_box.name == self._name:
-                raise ValueError("Cannot send to self")
+            target_box = self._target_box(target)
             result = await target_box._deliver_message(self._name, data)
             response = {"request_id": request_id, "result": result}
         except Exception as e:
             response = {"request_id": request_id, "error": str(e)}
         await self._send(response)
 
+    async def _handle_send_many(self, msg: dict) -> None:
+        request_id, target, items = (
+            msg.get("request_id"),
+            msg.get("target"),
+            msg.get("items") or [],
+        )
+        try:
+            target_box = self._target_box(target)
+            # Deliver every item concurrently and answer with one frame whose
+            # results line up with the items
+            results = await asyncio.gather(
+                *(target_box._deliver_message(self._name, data) for data in items),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            response = {"request_id": request_id, "results": results}
+        except Exception as e:
+            response = {"request_id": request_id, "error": str(e)}
+        await self._send(response)
+
+    def _target_box(self, target: str) -> "ManagedBox":
+        target_box = self._runtime._boxes.get(target)
+        if not target_box:
+            raise ValueError(f"Box '{target}' not found")
+        if target_box.name == self._name:
+            raise ValueError("Cannot send to self")
+        return target_box
+
     async def _handle_publish(self, msg: dict) -> None:
-        event, data = msg.get("event"), msg.get("data")
-        for name, box in self._runtime._boxes.items():
-            if name != self._name and box._execution:
-                try:
-                    await box._send({"type": "event", "event": event, "data": data})
-                except Exception:
-                    pass
+        event = msg.get("event")
+        # Guest scripts can register on_event handlers the host never sees,
+        # so every running box gets the event. Encode the frame once and
+        # write to all of them concurrently.
+        frame = _encode({"type": "event", "event": event, "data": msg.get("data")})
+        await asyncio.gather(
+            *(
+                box._write(frame)
+                for name, box in self._runtime._boxes.items()
+                if name != self._name and box._execution
+            ),
+            return_exceptions=True,
+        )
 
     def _handle_response(self, msg: dict) -> None:
         request_id = msg.get("request_id")
@@ -183,16 +301,38 @@ if _d["message_handlers"] or _d["event_handlers"]: run_forever()
                 future.set_result(msg.get("result"))
 
     async def _send(self, msg: dict) -> None:
-        if self._stdin:
-            await self._stdin.send_input((json.dumps(msg) + "\n").encode())
+        await self._write(_encode(msg))
+
+    async def _write(self, frame: bytes) -> None:
+        """Queue a frame for the guest and wait until it has been written.
+
+        Frames queued while a write is in flight go out together in the
+        next send_input() call, so bursts cost one write instead of one
+        per message without delaying a lone frame.
+        """
+        if not self._stdin:
+            return
+        self._outbox += frame
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.ensure_future(self._flush_outbox())
+        await asyncio.shield(self._flushing)
+
+    async def _flush_outbox(self) -> None:
+        while self._outbox:
+            data = bytes(self._outbox)
+            self._outbox.clear()
+            try:
+                await self._stdin.send_input(data)
+            except Exception:
+                self._outbox.clear()
+                raise
 
     async def _deliver_message(self, sender: str, data: Any) -> Any:
-        import uuid
-
         if not self._execution:
             raise RuntimeError(f"Box {self._name} not running")
-        request_id = str(uuid.uuid4())
-        future = asyncio.get_event_loop().create_future()
+        # Only needs to be unique among this box's pending requests
+        request_id = f"{self._name}-{next(self._request_ids)}"
+        future = asyncio.get_running_loop().create_future()
         self._pending[request_id] = future
         await self._send(
             {
@@ -213,6 +353,9 @@ if _d["message_handlers"] or _d["event_handlers"]: run_forever()
             return 0
         try:
             result = await self._execution.wait()
+            if self._pump_task:
+                # Let the pump relay whatever the guest wrote before exiting
+                await asyncio.wait([self._pump_task], timeout=_PUMP_DRAIN_TIMEOUT)
             return result.exit_code
         finally:
             if self._pump_task:
@@ -223,22 +366,31 @@ if _d["message_handlers"] or _d["event_handlers"]: run_forever()
                     pass
 
     async def stop(self) -> None:
+        # A stop() the caller started without awaiting may still be running
+        # when shutdown() stops every box; share it instead of racing it.
+        if self._stopping is None or self._stopping.done():
+            self._stopping = asyncio.ensure_future(self._stop())
+        await self._stopping
+
+    async def _stop(self) -> None:
         if self._execution:
-            try:
-                await self._send({"type": "shutdown"})
-            except Exception:
-                pass
-            if self._pump_task:
-                self._pump_task.cancel()
-            try:
-                await self._execution.kill()
-            except Exception:
-                pass
+            # The process is killed regardless, so the shutdown notice is a
+            # courtesy: bound it and do not hold the kill back behind it
+            await asyncio.gather(
+                asyncio.wait_for(self._write(_SHUTDOWN_FRAME), 0.5),
+                self._kill_execution(),
+                return_exceptions=True,
+            )
         self._execution = None
         if self._box:
             await self._box._box.stop()
         self._box = None
 
+    async def _kill_execution(self) -> None:
+        if self._pump_task:
+            self._pump_task.cancel()
+        await self._execution.kill()
+
 
 class BoxRuntime:
     """Multi-box orchestration runtime with auto Python version detection."""
@@ -265,6 +417,30 @@ class BoxRuntime:
         self._boxes[name] = box
         return box
 
+    async def create_boxes(self, specs: list[dict[str, Any]]) -> list[ManagedBox]:
+        """Create several boxes concurrently.
+
+        Each spec holds the keyword arguments for one create_box() call.
+        Boxes are returned in spec order; if any fails, the first error is
+        raised once all have settled, and the boxes that did start remain
+        registered so shutdown() cleans them up.
+        """
+        seen: set[str] = set()
+        for spec in specs:
+            name = spec["name"]
+            if name in self._boxes:
+                raise ValueError(f"Box '{name}' exists")
+            if name in seen:
+                raise ValueError(f"Duplicate box name in batch: '{name}'")
+            seen.add(name)
+        results = await asyncio.gather(
+            *(self.create_box(**spec) for spec in specs), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
     def list_boxes(self) -> list[str]:
         """Get list of all box names."""
         return list(self._boxes.keys())
@@ -3,25 +3,30 @@ BoxLite Guest Runtime - Messaging API for code running inside VMs.
 
 Protocol (JSON over stdin/stdout):
     Guest -> Host:
-        {"type": "send", "target": "box-name", "data": {...}, "request_id": "uuid"}
+        {"type": "send", "target": "box-name", "data": {...}, "request_id": "id"}
+        {"type": "send_many", "target": "box-name", "items": [...], "request_id": "id"}
         {"type": "publish", "event": "event-name", "data": {...}}
-        {"type": "response", "request_id": "uuid", "result": {...}}
+        {"type": "response", "request_id": "id", "result": {...}}
+        {"type": "ready"}
 
     Host -> Guest:
-        {"type": "message", "sender": "box-name", "data": {...}, "request_id": "uuid"}
+        {"type": "message", "sender": "box-name", "data": {...}, "request_id": "id"}
         {"type": "event", "event": "event-name", "data": {...}}
-        {"request_id": "uuid", "result": {...}}
+        {"request_id": "id", "result": {...}}
+        {"request_id": "id", "results": [...]}
         {"type": "shutdown"}
 """
 
 import sys
 import json
 import os
-import uuid
-from typing import Callable, Any
+import itertools
+import threading
+from typing import Callable, Any, Optional
 
 __all__ = [
     "send_message",
+    "send_many",
     "publish_event",
     "on_message",
     "on_event",
@@ -34,19 +39,80 @@ _message_handlers: list[Callable] = []
 _event_handlers: dict[str, list[Callable]] = {}
 _running = True
 
+# Messages written to stdout but not yet flushed to the host. A batch is
+# flushed once it holds _MAX_UNFLUSHED messages or its first message is
+# _MAX_DELAY seconds old, whichever comes first.
+_unflushed = 0
+_MAX_UNFLUSHED = 64
+_MAX_DELAY = 0.005
+_flush_timer: Optional[threading.Timer] = None
+_out_lock = threading.Lock()
+
 BOX_NAME = os.environ.get("BOXLITE_BOX_NAME", "unknown")
 
+# Request ids only need to be unique within this process
+_request_ids = itertools.count()
+
+
+def _emit(msg: dict, flush: bool = True) -> None:
+    """Write a message to the host, flushing now or once the batch is due."""
+    global _unflushed, _flush_timer
+    # json's ASCII-only output keeps frames intact when the host decodes
+    # stdout chunk by chunk, and it preserves NaN/Infinity
+    line = json.dumps(msg) + "\n"
+    with _out_lock:
+        sys.stdout.write(line)
+        _unflushed += 1
+        if flush or _unflushed >= _MAX_UNFLUSHED:
+            _flush_locked()
+        elif _flush_timer is None:
+            _flush_timer = threading.Timer(_MAX_DELAY, _flush)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def _flush() -> None:
+    with _out_lock:
+        _flush_locked()
+
+
+def _flush_locked() -> None:
+    global _unflushed, _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _unflushed:
+        sys.stdout.flush()
+        _unflushed = 0
+
 
 def send_message(target: str, data: Any) -> Any:
     """Send message to another box and wait for response."""
-    request_id = str(uuid.uuid4())
-    print(
-        json.dumps(
-            {"type": "send", "target": target, "data": data, "request_id": request_id}
-        ),
-        flush=True,
+    request_id = f"{BOX_NAME}-{next(_request_ids)}"
+    _emit({"type": "send", "target": target, "data": data, "request_id": request_id})
+
+    return _await_response(request_id).get("result")
+
+
+def send_many(target: str, items: list) -> list:
+    """Send several messages to another box in one round trip.
+
+    The host delivers the items concurrently; the results come back in the
+    same order. Raises if any delivery fails.
+    """
+    request_id = f"{BOX_NAME}-{next(_request_ids)}"
+    _emit(
+        {
+            "type": "send_many",
+            "target": target,
+            "items": items,
+            "request_id": request_id,
+        }
     )
+    return _await_response(request_id).get("results")
+
 
+def _await_response(request_id: str) -> dict:
     response_line = sys.stdin.readline()
     if not response_line:
         raise RuntimeError("Connection closed")
@@ -56,12 +122,16 @@ def send_message(target: str, data: Any) -> Any:
         raise RuntimeError("Response ID mismatch")
     if "error" in response:
         raise RuntimeError(response["error"])
-    return response.get("result")
+    return response
 
 
 def publish_event(event: str, data: Any = None) -> None:
-    """Publish event to all subscribers (fire-and-forget)."""
-    print(json.dumps({"type": "publish", "event": event, "data": data}), flush=True)
+    """Publish event to all subscribers (fire-and-forget).
+
+    Events are batched and reach the host within a few milliseconds, or
+    sooner if the batch fills up or the runtime blocks on stdin.
+    """
+    _emit({"type": "publish", "event": event, "data": data}, flush=False)
 
 
 def on_message(handler: Callable[[str, Any], Any]) -> Callable:
@@ -91,8 +161,14 @@ def run_forever():
     global _running
     _running = True
 
-    for line in sys.stdin:
-        if not _running:
+    # Tell the host the handlers are registered and messages can be sent
+    _emit({"type": "ready"})
+
+    while _running:
+        # Hand off anything handlers published before blocking on stdin
+        _flush()
+        line = sys.stdin.readline()
+        if not line:
             break
 
         line = line.strip()
@@ -117,26 +193,12 @@ def run_forever():
                     except Exception as e:
                         error = str(e)
                 if error:
-                    print(
-                        json.dumps(
-                            {
-                                "type": "response",
-                                "request_id": request_id,
-                                "error": error,
-                            }
-                        ),
-                        flush=True,
+                    _emit(
+                        {"type": "response", "request_id": request_id, "error": error}
                     )
                 else:
-                    print(
-                        json.dumps(
-                            {
-                                "type": "response",
-                                "request_id": request_id,
-                                "result": result,
-                            }
-                        ),
-                        flush=True,
+                    _emit(
+                        {"type": "response", "request_id": request_id, "result": result}
                     )
 
             elif msg_type == "event":
@@ -153,4 +215,4 @@ def run_forever():
         except json.JSONDecodeError:
             pass
         except Exception as e:
-            print(json.dumps({"type": "error", "error": str(e)}), flush=True)
+            _emit({"type": "error", "error": str(e)})
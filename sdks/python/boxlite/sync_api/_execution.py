@@ -88,6 +88,10 @@ class SyncExecStdout:
         except StopAsyncIteration:
             raise StopIteration
 
+    def read(self) -> str:
+        """Read the rest of stdout and return it as a single string."""
+        return self._sync(self._async_stdout.read())
+
 
 class SyncExecStderr:
     """
@@ -133,6 +137,10 @@ class SyncExecStderr:
         except StopAsyncIteration:
             raise StopIteration
 
+    def read(self) -> str:
+        """Read the rest of stderr and return it as a single string."""
+        return self._sync(self._async_stderr.read())
+
 
 class SyncExecution:
     """
@@ -30,6 +30,23 @@ impl PyExecStdout {
         Ok(Some(future))
     }
 
+    /// Read the rest of the stream and return it as a single string.
+    ///
+    /// Drains the stream in one awaitable instead of one per chunk.
+    fn read<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyAny>> {
+        let stream = Arc::clone(&self.stream);
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            use futures::StreamExt;
+            let mut guard = stream.lock().await;
+            let mut output = String::new();
+            while let Some(chunk) = guard.next().await {
+                output.push_str(&chunk);
+            }
+            Ok(output)
+        })
+    }
+
     fn __repr__(&self) -> String {
         "ExecStdout(...)".to_string()
     }
@@ -105,6 +122,23 @@ impl PyExecStderr {
         Ok(Some(future))
     }
 
+    /// Read the rest of the stream and return it as a single string.
+    ///
+    /// Drains the stream in one awaitable instead of one per chunk.
+    fn read<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyAny>> {
+        let stream = Arc::clone(&self.stream);
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            use futures::StreamExt;
+            let mut guard = stream.lock().await;
+            let mut output = String::new();
+            while let Some(chunk) = guard.next().await {
+                output.push_str(&chunk);
+            }
+            Ok(output)
+        })
+    }
+
     fn __repr__(&self) -> String {
         "ExecStderr(...)".to_string()
     }
@@ -232,5 +232,42 @@ class TestSyncExecutionAPIExports:
             pytest.skip("sync API not available")
 
 
+@pytest.mark.integration
+class TestExecStreamRead:
+    """Test draining exec streams with read() (async API, requires VM)."""
+
+    @pytest.mark.asyncio
+    async def test_stdout_read(self, shared_runtime):
+        """Can read all of stdout in one await."""
+        box = await shared_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
+        try:
+            execution = await box.exec(
+                "sh", ["-c", "echo line1; echo line2; echo line3"]
+            )
+
+            output = await execution.stdout().read()
+
+            assert output.splitlines() == ["line1", "line2", "line3"]
+            await execution.wait()
+        finally:
+            await box.stop()
+
+    @pytest.mark.asyncio
+    async def test_stderr_read(self, shared_runtime):
+        """Can read all of stderr in one await, separately from stdout."""
+        box = await shared_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
+        try:
+            execution = await box.exec(
+                "sh", ["-c", "echo out; echo err1 >&2; echo err2 >&2"]
+            )
+
+            output = await execution.stderr().read()
+
+            assert output.splitlines() == ["err1", "err2"]
+            await execution.wait()
+        finally:
+            await box.stop()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
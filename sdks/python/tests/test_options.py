@@ -304,6 +304,16 @@ class TestEntrypointOptions:
         assert opts.entrypoint == []
 
 
+class TestBrowserBoxOptions:
+    """Test BrowserBoxOptions validation."""
+
+    def test_unknown_browser_rejected(self):
+        """Test that an unknown browser fails before any VM is created."""
+        opts = boxlite.BrowserBoxOptions(browser="netscape")
+        with pytest.raises(ValueError, match="netscape"):
+            boxlite.BrowserBox(opts)
+
+
 class TestCmdIntegration:
     """Integration tests for cmd override (require VM)."""
 
@@ -0,0 +1,472 @@
+"""
+Unit tests for BoxRuntime messaging (no VM required).
+
+The host side is driven through ManagedBox with fake stdin streams; the
+guest runtime is plain Python and is run in a subprocess over pipes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from boxlite.orchestration.box_runtime import BoxRuntime, ManagedBox
+
+GUEST_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "boxlite", "orchestration", "guest"
+)
+
+
+class RecordingStdin:
+    """Collects every frame written to a box."""
+
+    def __init__(self):
+        self.frames: list[dict] = []
+
+    async def send_input(self, data: bytes) -> None:
+        self.frames.extend(json.loads(line) for line in data.splitlines())
+
+
+class GuestStdin:
+    """Answers "message" frames the way a guest handler would."""
+
+    def __init__(self, box: ManagedBox, handler):
+        self._box = box
+        self._handler = handler
+        self._received = 0
+
+    async def send_input(self, data: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        for line in data.splitlines():
+            # Answer later messages sooner so ordering can't come for free
+            delay = max(0.0, 0.05 - 0.004 * self._received)
+            self._received += 1
+            loop.call_later(delay, self._respond, json.loads(line))
+
+    def _respond(self, msg: dict) -> None:
+        try:
+            response = {"result": self._handler(msg["data"])}
+        except Exception as e:
+            response = {"error": str(e)}
+        response.update(type="response", request_id=msg["request_id"])
+        asyncio.ensure_future(self._box._handle_line(json.dumps(response)))
+
+
+def make_boxes(handler):
+    runtime = BoxRuntime()
+    sender = ManagedBox(runtime, "a")
+    target = ManagedBox(runtime, "b")
+    runtime._boxes.update(a=sender, b=target)
+    sender._stdin = RecordingStdin()
+    target._execution = object()
+    target._stdin = GuestStdin(target, handler)
+    return sender, target
+
+
+class TestHandleSendMany:
+    """Host-side handling of send_many frames."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_item_order(self):
+        """Test that results line up with the items."""
+        sender, _ = make_boxes(lambda data: data * 2)
+        await sender._handle_line(
+            json.dumps(
+                {
+                    "type": "send_many",
+                    "target": "b",
+                    "items": list(range(12)),
+                    "request_id": "a-7",
+                }
+            )
+        )
+        assert sender._stdin.frames == [
+            {"request_id": "a-7", "results": [n * 2 for n in range(12)]}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_item_returns_error(self):
+        """Test that one failing item turns the reply into an error."""
+
+        def handler(data):
+            if data == "bad":
+                raise ValueError("cannot handle bad")
+            return data
+
+        sender, _ = make_boxes(handler)
+        await sender._handle_line(
+            json.dumps(
+                {
+                    "type": "send_many",
+                    "target": "b",
+                    "items": ["ok", "bad", "ok"],
+                    "request_id": "a-0",
+                }
+            )
+        )
+        assert sender._stdin.frames == [
+            {"request_id": "a-0", "error": "cannot handle bad"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_target(self):
+        """Test that an unknown target is reported with the request id."""
+        sender, _ = make_boxes(lambda data: data)
+        await sender._handle_line(
+            json.dumps(
+                {
+                    "type": "send_many",
+                    "target": "missing",
+                    "items": [1],
+                    "request_id": "a-3",
+                }
+            )
+        )
+        assert sender._stdin.frames == [
+            {"request_id": "a-3", "error": "Box 'missing' not found"}
+        ]
+
+
+def run_guest(code: str, reply: dict) -> subprocess.CompletedProcess:
+    """Run code against boxlite_runtime with `reply` queued on stdin."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        input=json.dumps(reply) + "\n",
+        capture_output=True,
+        text=True,
+        timeout=30,
+        cwd=GUEST_DIR,
+        env={**os.environ, "BOXLITE_BOX_NAME": "a", "PYTHONPATH": GUEST_DIR},
+    )
+
+
+SEND_MANY = """
+import json, sys
+from boxlite_runtime import send_many
+try:
+    print(json.dumps(send_many("b", [1, 2, 3])), file=sys.stderr)
+except RuntimeError as e:
+    print("error:", e, file=sys.stderr)
+"""
+
+
+class TestGuestSendMany:
+    """Guest-side send_many over stdin/stdout."""
+
+    def test_single_frame_and_results(self):
+        """Test that all items go out in one frame and results come back."""
+        proc = run_guest(SEND_MANY, {"request_id": "a-0", "results": [2, 4, 6]})
+        assert json.loads(proc.stdout) == {
+            "type": "send_many",
+            "target": "b",
+            "items": [1, 2, 3],
+            "request_id": "a-0",
+        }
+        assert json.loads(proc.stderr) == [2, 4, 6]
+
+    def test_error_raises(self):
+        """Test that an error reply raises RuntimeError."""
+        proc = run_guest(SEND_MANY, {"request_id": "a-0", "error": "boom"})
+        assert proc.stderr.strip() == "error: boom"
+
+    def test_request_id_mismatch_raises(self):
+        """Test that a reply for another request is rejected."""
+        proc = run_guest(SEND_MANY, {"request_id": "a-9", "results": [2, 4, 6]})
+        assert proc.stderr.strip() == "error: Response ID mismatch"
+
+
+class TestGuestFrames:
+    """Encoding of guest -> host frames."""
+
+    def test_frames_are_ascii(self):
+        """Test that non-ASCII data and NaN survive chunked decoding."""
+        code = (
+            "from boxlite_runtime import publish_event\n"
+            "publish_event('e', {'text': 'é' * 2000, 'x': float('nan')})\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            timeout=30,
+            env={**os.environ, "PYTHONPATH": GUEST_DIR},
+        )
+        assert proc.stdout.isascii()
+        frame = json.loads(proc.stdout)
+        assert frame["data"]["text"] == "é" * 2000
+        assert frame["data"]["x"] != frame["data"]["x"]  # NaN
+
+    def test_batched_event_flushed_without_blocking_call(self):
+        """Test that a published event is not held back by a long task."""
+        code = (
+            "import time\n"
+            "from boxlite_runtime import publish_event\n"
+            "publish_event('e', 1)\n"
+            "time.sleep(30)\n"
+        )
+        proc = subprocess.Popen(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE,
+            env={**os.environ, "PYTHONPATH": GUEST_DIR},
+        )
+        try:
+            start = time.monotonic()
+            line = proc.stdout.readline()
+            assert time.monotonic() - start < 10
+            assert json.loads(line) == {"type": "publish", "event": "e", "data": 1}
+        finally:
+            proc.kill()
+            proc.wait()
+
+
+class ChunkStream:
+    """Async iterator over fixed stdout chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class TestMessagePump:
+    """Host-side line splitting of guest stdout."""
+
+    @pytest.mark.asyncio
+    async def test_split_and_coalesced_chunks(self):
+        """Test that lines are rebuilt across chunk boundaries."""
+        box = ManagedBox(BoxRuntime(), "a")
+        box._stdout = ChunkStream(
+            [
+                '{"n": 1}\n{"n": ',  # one full line plus the head of the next
+                "2}",
+                "\n",
+                b'{"n": 3}\n{"n": 4}\n',  # coalesced, as bytes
+                '{"n": 5}',  # tail without a newline is never a frame
+            ]
+        )
+        lines = []
+
+        async def record(line):
+            lines.append(line)
+
+        box._handle_line = record
+        await box._message_pump()
+        assert [json.loads(line)["n"] for line in lines] == [1, 2, 3, 4]
+
+
+class SlowStdin:
+    """Records each send_input call; optionally fails them."""
+
+    def __init__(self, error: Exception | None = None):
+        self.writes: list[bytes] = []
+        self._error = error
+
+    async def send_input(self, data: bytes) -> None:
+        await asyncio.sleep(0.01)
+        self.writes.append(data)
+        if self._error:
+            raise self._error
+
+
+class TestOutbox:
+    """Coalescing of frames written to a box's stdin."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_coalesce(self):
+        """Test that frames queued together go out in one send_input."""
+        box = ManagedBox(BoxRuntime(), "a")
+        box._stdin = SlowStdin()
+        await asyncio.gather(*(box._write(b"%d\n" % n) for n in range(5)))
+        assert box._stdin.writes == [b"0\n1\n2\n3\n4\n"]
+
+    @pytest.mark.asyncio
+    async def test_frames_queued_during_write_follow(self):
+        """Test that frames queued mid-write go out in the next call."""
+        box = ManagedBox(BoxRuntime(), "a")
+        box._stdin = SlowStdin()
+        first = asyncio.ensure_future(box._write(b"0\n"))
+        await asyncio.sleep(0)  # let the first write reach send_input
+        await asyncio.gather(first, box._write(b"1\n"), box._write(b"2\n"))
+        assert box._stdin.writes == [b"0\n", b"1\n2\n"]
+
+    @pytest.mark.asyncio
+    async def test_write_error_reaches_every_writer(self):
+        """Test that a failed drain raises in all waiting writers."""
+        box = ManagedBox(BoxRuntime(), "a")
+        box._stdin = SlowStdin(OSError("pipe closed"))
+        results = await asyncio.gather(
+            *(box._write(b"%d\n" % n) for n in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, OSError) for r in results)
+        assert not box._outbox
+
+
+def running_box(chunks) -> ManagedBox:
+    """A box whose guest stdout yields `chunks`, as right after run()."""
+    box = ManagedBox(BoxRuntime(), "a")
+    box._stdout = ChunkStream(chunks)
+    box._ready = asyncio.get_running_loop().create_future()
+    box._pump_task = asyncio.create_task(box._message_pump())
+    return box
+
+
+class TestReady:
+    """ManagedBox.ready() and the guest's ready frame."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_on_ready_frame(self):
+        """Test that ready() returns once the ready frame arrives."""
+        box = running_box(['{"type": "ready"}\n'])
+        await box.ready(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_raises_if_guest_exits_first(self):
+        """Test that ready() fails when stdout ends without a ready frame."""
+        box = running_box(["Traceback (most recent call last):\n"])
+        with pytest.raises(RuntimeError, match="exited before ready"):
+            await box.ready(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_raises_when_not_running(self):
+        """Test that ready() refuses a box that was never run."""
+        with pytest.raises(RuntimeError, match="Not running"):
+            await ManagedBox(BoxRuntime(), "a").ready()
+
+    def test_guest_sends_ready_frame(self):
+        """Test that run_forever() announces readiness before reading."""
+        proc = subprocess.run(
+            [sys.executable, "-c", "import boxlite_runtime as r; r.run_forever()"],
+            input="",
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env={**os.environ, "PYTHONPATH": GUEST_DIR},
+        )
+        assert json.loads(proc.stdout) == {"type": "ready"}
+
+
+class TestCreateBoxes:
+    """BoxRuntime.create_boxes() validation and error handling."""
+
+    @pytest.fixture
+    def started(self, monkeypatch):
+        """Replace VM startup; names starting with "bad" fail to start."""
+        started = []
+
+        async def start(box):
+            # Later specs finish first, so spec order can't come for free
+            await asyncio.sleep(0.01 * (5 - len(started)))
+            started.append(box.name)
+            if box.name.startswith("bad"):
+                raise RuntimeError(f"{box.name} failed")
+            return box
+
+        monkeypatch.setattr(ManagedBox, "start", start)
+        return started
+
+    @pytest.mark.asyncio
+    async def test_returns_boxes_in_spec_order(self, started):
+        """Test that boxes come back in spec order and are registered."""
+        runtime = BoxRuntime()
+        boxes = await runtime.create_boxes([{"name": "x"}, {"name": "y"}])
+        assert [box.name for box in boxes] == ["x", "y"]
+        assert sorted(runtime.list_boxes()) == ["x", "y"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_in_batch(self, started):
+        """Test that a repeated name is rejected before anything starts."""
+        runtime = BoxRuntime()
+        with pytest.raises(ValueError, match="Duplicate box name in batch: 'x'"):
+            await runtime.create_boxes([{"name": "x"}, {"name": "y"}, {"name": "x"}])
+        assert started == []
+        assert runtime.list_boxes() == []
+
+    @pytest.mark.asyncio
+    async def test_existing_name(self, started):
+        """Test that a name already in the runtime is rejected up front."""
+        runtime = BoxRuntime()
+        await runtime.create_box("x")
+        started.clear()
+        with pytest.raises(ValueError, match="Box 'x' exists"):
+            await runtime.create_boxes([{"name": "y"}, {"name": "x"}])
+        assert started == []
+        assert runtime.list_boxes() == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_first_error_raised_after_all_settle(self, started):
+        """Test that the first failing spec's error is raised."""
+        runtime = BoxRuntime()
+        with pytest.raises(RuntimeError, match="bad1 failed"):
+            await runtime.create_boxes(
+                [{"name": "ok"}, {"name": "bad1"}, {"name": "bad2"}]
+            )
+        assert sorted(started) == ["bad1", "bad2", "ok"]
+        # The box that did start stays registered for shutdown()
+        assert runtime.list_boxes() == ["ok"]
+
+
+class FakeExecution:
+    def __init__(self):
+        self.kills = 0
+
+    async def kill(self):
+        self.kills += 1
+
+
+class StalledStdin:
+    """A guest that never reads its stdin."""
+
+    async def send_input(self, data: bytes) -> None:
+        await asyncio.Event().wait()
+
+
+class FakeVm:
+    def __init__(self):
+        self.stops = 0
+
+    async def stop(self):
+        await asyncio.sleep(0.01)
+        self.stops += 1
+
+
+def stoppable_box(stdin) -> tuple[ManagedBox, FakeExecution, FakeVm]:
+    box = ManagedBox(BoxRuntime(), "a")
+    execution, vm = FakeExecution(), FakeVm()
+    box._execution = execution
+    box._stdin = stdin
+    box._box = type("SimpleBoxStub", (), {"_box": vm})()
+    return box, execution, vm
+
+
+class TestStop:
+    """ManagedBox.stop() teardown."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stops_share_one_shutdown(self):
+        """Test that overlapping stop() calls tear the box down once."""
+        box, execution, vm = stoppable_box(RecordingStdin())
+        await asyncio.gather(box.stop(), box.stop())
+        assert execution.kills == 1
+        assert vm.stops == 1
+        assert box._stdin.frames == [{"type": "shutdown"}]
+        assert box._execution is None and box._box is None
+
+    @pytest.mark.asyncio
+    async def test_stalled_stdin_still_kills(self):
+        """Test that a guest not reading stdin is killed within the timeout."""
+        box, execution, vm = stoppable_box(StalledStdin())
+        await asyncio.wait_for(box.stop(), timeout=5)
+        assert execution.kills == 1
+        assert vm.stops == 1
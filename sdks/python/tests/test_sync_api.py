@@ -200,6 +200,17 @@ class TestSyncExecution:
         execution.wait()
         box.stop()
 
+    def test_stdout_read(self, shared_sync_runtime):
+        """Can read all of stdout in one call."""
+        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
+        execution = box.exec("sh", ["-c", "echo line1; echo line2; echo line3"])
+
+        output = execution.stdout().read()
+
+        assert output.splitlines() == ["line1", "line2", "line3"]
+        execution.wait()
+        box.stop()
+
     def test_resize_tty_on_tty_execution(self, shared_sync_runtime):
         """resize_tty succeeds on a TTY-enabled execution."""
         box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))